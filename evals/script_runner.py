@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Run Python CLI scripts for tests and benchmarks.
+
+run_script() executes a script as __main__ inside the current interpreter,
+so repeated runs skip Python startup. run_script_subprocess() starts the
+script as its own process; use it to cover what in-process runs skip: the
+shebang, the real exit status and import-time behavior.
+
+Run as a program, this module is a persistent driver. It reads one JSON
+request per line from stdin, runs the requested script in-process and
+writes one JSON response per line:
+
+    request:  {"script": "/path/to/tool", "args": ["..."], "stdin": null}
+    response: [returncode, stdout, stderr]
+
+Test harnesses and benchmarks keep a driver alive so Python startup is
+paid once instead of once per CLI invocation. Responses go out on a
+private copy of the original stdout; anything else written to stdout
+while the driver runs goes to stderr.
+
+Usage:
+    from script_runner import run_script, run_script_subprocess
+
+    rc, stdout, stderr = run_script("/path/to/tool", ["--help"])
+
+    python evals/script_runner.py < requests.jsonl
+"""
+
+import io
+import json
+import os
+import runpy
+import signal
+import subprocess
+import sys
+import sysconfig
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import List, Optional, Tuple
+
+# Modules under these directories (standard library, installed packages)
+# stay imported between runs; anything else a script imports is project
+# code and is dropped after each run
+_LIBRARY_DIRS = tuple({
+    os.path.realpath(path) + os.sep
+    for name, path in sysconfig.get_paths().items()
+    if name in ("stdlib", "platstdlib", "purelib", "platlib")
+})
+
+
+def _is_library_module(module) -> bool:
+    """True for built-in, standard library and installed-package modules."""
+    path = getattr(module, "__file__", None)
+    return path is None or os.path.realpath(path).startswith(_LIBRARY_DIRS)
+
+
+class _ScriptTimeout(BaseException):
+    """Raised inside a script when its run_script() timeout expires.
+
+    Not an Exception subclass, so `except Exception` in the script does not
+    swallow it.
+    """
+
+
+def run_script(
+    script: str,
+    args: List[str],
+    stdin_input: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[int, str, str]:
+    """
+    Run a script in this process as __main__.
+
+    The script gets fresh globals on every call. Project modules it imports
+    (e.g. speaker_detection_backends) are removed from sys.modules afterwards,
+    so their module-level caches start empty on the next run. Standard
+    library and installed packages stay loaded. stdout/stderr redirection is
+    process-wide, so callers must not run two at once.
+
+    The timeout is enforced with SIGALRM, so it needs the main thread on a
+    Unix platform. It interrupts Python code and blocking system calls
+    (sockets, sleep), but not a long-running C function.
+
+    Args:
+        script: Path to the script
+        args: Command-line arguments (without the script name)
+        stdin_input: Text the script reads from stdin (default: empty)
+        timeout: Seconds before the script is interrupted (default: no limit)
+
+    Returns:
+        (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the script runs longer than timeout
+        ValueError: If a timeout is given off the main thread or without SIGALRM
+    """
+    if timeout is not None and (
+        not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread()
+    ):
+        raise ValueError("run_script() timeouts need SIGALRM and the main thread")
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_argv, saved_stdin = sys.argv, sys.stdin
+    loaded = set(sys.modules)
+    sys.argv = [script, *args]
+    sys.stdin = io.StringIO(stdin_input or "")
+    returncode = 0
+    timed_out = False
+    armed = False
+
+    def expire(signum, frame):
+        if armed:
+            raise _ScriptTimeout()
+
+    if timeout is not None:
+        saved_handler = signal.signal(signal.SIGALRM, expire)
+        armed = True
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                runpy.run_path(script, run_name="__main__")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    except _ScriptTimeout:
+        timed_out = True
+    finally:
+        armed = False
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, saved_handler)
+        sys.argv, sys.stdin = saved_argv, saved_stdin
+        for name in set(sys.modules) - loaded:
+            if not _is_library_module(sys.modules[name]):
+                del sys.modules[name]
+
+    if timed_out:
+        raise subprocess.TimeoutExpired([script, *args], timeout, out.getvalue(), err.getvalue())
+    return returncode, out.getvalue(), err.getvalue()
+
+
+def run_script_subprocess(
+    script: str,
+    args: List[str],
+    stdin_input: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[int, str, str]:
+    """
+    Run a script as its own process, through its shebang.
+
+    Args:
+        script: Path to the (executable) script
+        args: Command-line arguments (without the script name)
+        stdin_input: Text written to the script's stdin
+        timeout: Seconds before the process is killed (default: no limit)
+
+    Returns:
+        (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the script runs longer than timeout
+    """
+    result = subprocess.run(
+        [script, *args],
+        input=stdin_input,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    return result.returncode, result.stdout, result.stderr
+
+
+def _reserve_protocol_stdout():
+    """
+    Move stdout to a private descriptor for protocol responses.
+
+    File descriptor 1 is then pointed at stderr. Output that bypasses
+    run_script()'s redirection (sys.__stdout__, os.write(1, ...), child
+    processes, C extensions) ends up on stderr instead of corrupting a
+    response line.
+    """
+    sys.stdout.flush()
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return protocol_out
+
+
+def main():
+    protocol_out = _reserve_protocol_stdout()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        rc, stdout, stderr = run_script(
+            request["script"],
+            request.get("args", []),
+            request.get("stdin"),
+        )
+        protocol_out.write(json.dumps([rc, stdout, stderr]) + "\n")
+        protocol_out.flush()
+
+
+if __name__ == "__main__":
+    main()
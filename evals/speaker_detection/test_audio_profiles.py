@@ -164,6 +164,12 @@ def test_format_ffmpeg_args_basic() -> TestResult:
         result.error = "Missing format value"
         return result
 
+    # Repeated calls return a fresh list that callers may extend
+    args.append("extra")
+    if format_ffmpeg_args(profile)[-1] == "extra":
+        result.error = "format_ffmpeg_args() returned a shared list"
+        return result
+
     result.passed = True
     return result
 
@@ -219,6 +225,13 @@ def test_format_ffmpeg_args_bit_depth() -> TestResult:
         result.error = "32-bit wav should use pcm_s32le codec"
         return result
 
+    # Test 8-bit
+    profile = AudioProfile(sample_rate=16000, channels=1, format="wav", bit_depth=8)
+    args = format_ffmpeg_args(profile)
+    if "-acodec" not in args or "pcm_u8" not in args:
+        result.error = "8-bit wav should use pcm_u8 codec"
+        return result
+
     result.passed = True
     return result
 
@@ -10,11 +10,14 @@ Usage:
     ./test_cli.py -v           # Verbose output
 """
 
+import io
 import json
 import os
 import subprocess
 import sys
 import tempfile
+import threading
+import types
 import shutil
 from pathlib import Path
 
@@ -22,6 +25,11 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 REPO_ROOT = SCRIPT_DIR.parent.parent
 SPEAKER_DETECTION = REPO_ROOT / "speaker_detection"
 
+# Library tests below import the backends package directly
+sys.path.insert(0, str(REPO_ROOT))
+
+from speaker_detection_backends import base, migrations, schemas
+
 
 class TestResult:
     def __init__(self, name: str):
@@ -707,6 +715,363 @@ def test_embeddings_command(temp_dir: Path) -> TestResult:
     return result
 
 
+def test_validate_checks_stored_profiles(temp_dir: Path) -> TestResult:
+    """Test that validate checks profile files as stored, without migrating them."""
+    result = TestResult("validate_checks_stored_profiles")
+    env = {"SPEAKERS_EMBEDDINGS_DIR": str(temp_dir)}
+
+    db_dir = temp_dir / "db"
+    db_dir.mkdir(parents=True)
+    profiles = {
+        "old-a": {"id": "old-a", "names": {"default": "A"}},
+        "old-b": {"id": "old-b", "names": {"default": "B"}, "version": 0},
+        "bad-version": {"id": "bad-version", "names": {"default": "C"}, "version": "1"},
+    }
+    stored = {}
+    for speaker_id, profile in profiles.items():
+        path = db_dir / f"{speaker_id}.json"
+        path.write_text(json.dumps(profile))
+        stored[path] = path.read_text()
+
+    rc, stdout, stderr = run_cmd(["validate"], env)
+    if rc != 0:
+        result.error = f"validate failed: {stderr}"
+        return result
+
+    if "Migrated" in stderr:
+        result.error = f"validate printed migration notices: {stderr!r}"
+        return result
+
+    if "Profile 'version' must be an int, got str" not in stdout:
+        result.error = f"Expected the bad version to be reported, got: {stdout}"
+        return result
+
+    if "Validated 3 profiles" not in stdout or "2 profiles need migration" not in stdout:
+        result.error = f"Expected summary with 2 profiles needing migration, got: {stdout}"
+        return result
+
+    # validate is read-only: the files stay as they were
+    if any(path.read_text() != text for path, text in stored.items()):
+        result.error = "validate rewrote profile files"
+        return result
+
+    result.passed = True
+    return result
+
+
+# ----------------------------------------------------------------------
+# Library tests (speaker_detection_backends)
+# ----------------------------------------------------------------------
+
+def _validation_fixtures(count: int) -> dict:
+    """Profiles, embeddings and sample metadata with a mix of valid and invalid items."""
+    profiles = []
+    for i in range(count):
+        profile = {"id": f"speaker-{i}", "names": {"default": f"Speaker {i}"}, "version": 1}
+        if i % 7 == 0:
+            profile["tags"] = ["ok", i]  # non-string tag
+        if i % 11 == 0:
+            del profile["names"]
+        profiles.append(profile)
+
+    embeddings = [
+        {"id": f"emb-{i}", "external_id": f"ext-{i}", "created_at": "2024-01-01T00:00:00"}
+        if i % 3 else {"id": f"emb-{i}"}
+        for i in range(count // 10)
+    ]
+    samples = [
+        {"sample_id": f"sample-{i}", "source": {}, "segment": {}, "version": 2}
+        if i % 5 else {"sample_id": f"sample-{i}"}
+        for i in range(count // 10)
+    ]
+    return {"profiles": profiles, "embeddings": embeddings, "sample_metadata": samples}
+
+
+def test_validate_all_pooled_matches_serial(temp_dir: Path) -> TestResult:
+    """Test that validate_all gives the same warnings with and without a process pool."""
+    result = TestResult("validate_all_pooled_matches_serial")
+
+    fixtures = _validation_fixtures(schemas._PARALLEL_MIN_ITEMS + 100)
+
+    serial = schemas.validate_all(**fixtures)
+    pooled = schemas.validate_all(**fixtures, workers=2)
+
+    if not serial:
+        result.error = "Fixtures produced no warnings; the comparison proves nothing"
+        return result
+
+    if pooled != serial:
+        diff = [k for k in serial.keys() | pooled.keys() if serial.get(k) != pooled.get(k)]
+        result.error = f"Pooled warnings differ from serial ({len(diff)} keys differ)"
+        return result
+
+    if list(pooled) != list(serial):
+        result.error = "Pooled warnings are in a different order from serial"
+        return result
+
+    result.passed = True
+    return result
+
+
+def test_validate_all_small_input_stays_serial(temp_dir: Path) -> TestResult:
+    """Test that validate_all does not start a process pool for small inputs."""
+    result = TestResult("validate_all_small_input_stays_serial")
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    fixtures = _validation_fixtures(50)
+    original = schemas.ProcessPoolExecutor
+    schemas.ProcessPoolExecutor = no_pool
+    try:
+        warnings = schemas.validate_all(**fixtures, workers=4)
+        empty = schemas.validate_all(workers=4)
+    except AssertionError as e:
+        result.error = f"Small run was not serial: {e}"
+        return result
+    finally:
+        schemas.ProcessPoolExecutor = original
+
+    if warnings != schemas.validate_all(**fixtures):
+        result.error = "Small run with workers=4 differs from the serial result"
+        return result
+
+    if empty != {}:
+        result.error = f"Empty run returned warnings: {empty}"
+        return result
+
+    result.passed = True
+    return result
+
+
+def test_validate_all_quick_mode(temp_dir: Path) -> TestResult:
+    """Test what validate_all(quick=True) skips and what it still checks."""
+    result = TestResult("validate_all_quick_mode")
+
+    profiles = [
+        # Current version with required fields: quick skips the bad tags
+        {"id": "current", "names": {"default": "C"}, "version": 1, "tags": [1]},
+        # Old version: always fully validated
+        {"id": "old", "names": {"default": "O"}, "version": 0, "tags": [1]},
+        # Missing a required field: always fully validated
+        {"id": "incomplete", "version": 1, "tags": [1]},
+    ]
+    embeddings = [{"id": "emb"}]  # no version field: never skipped
+
+    full = schemas.validate_all(profiles=profiles, embeddings=embeddings)
+    quick = schemas.validate_all(profiles=profiles, embeddings=embeddings, quick=True)
+
+    expected_full = {"profile:current", "profile:old", "profile:incomplete", "embedding:emb"}
+    if set(full) != expected_full:
+        result.error = f"Full mode keys: expected {sorted(expected_full)}, got {sorted(full)}"
+        return result
+
+    expected_quick = expected_full - {"profile:current"}
+    if set(quick) != expected_quick:
+        result.error = f"Quick mode keys: expected {sorted(expected_quick)}, got {sorted(quick)}"
+        return result
+
+    if any(quick[key] != full[key] for key in quick):
+        result.error = "Quick mode changed the warnings of items it validated"
+        return result
+
+    result.passed = True
+    return result
+
+
+def test_batch_migration_messages(temp_dir: Path) -> TestResult:
+    """Test that batched migration messages nest, flush once, and stay per-thread."""
+    result = TestResult("batch_migration_messages")
+
+    def old_profile(speaker_id):
+        return {"id": speaker_id, "names": {"default": speaker_id}}
+
+    outer_stream, inner_stream = io.StringIO(), io.StringIO()
+    with migrations.batch_migration_messages(outer_stream):
+        migrations.migrate_profile(old_profile("first"))
+        with migrations.batch_migration_messages(inner_stream):
+            migrations.migrate_profile(old_profile("nested"))
+        if outer_stream.getvalue() or inner_stream.getvalue():
+            result.error = "Messages were written before the outermost block exited"
+            return result
+
+    expected = "Migrated profile 'first' to v1\nMigrated profile 'nested' to v1\n"
+    if outer_stream.getvalue() != expected:
+        result.error = f"Outer block wrote {outer_stream.getvalue()!r}, expected {expected!r}"
+        return result
+    if inner_stream.getvalue():
+        result.error = "Nested block wrote to its own stream instead of the outer block"
+        return result
+
+    # A block with no migrations writes nothing
+    empty_stream = io.StringIO()
+    with migrations.batch_migration_messages(empty_stream):
+        migrations.migrate_profile({"id": "current", "names": {}, "version": 1})
+    if empty_stream.getvalue():
+        result.error = f"Empty block wrote {empty_stream.getvalue()!r}"
+        return result
+
+    # A batch open in this thread does not collect another thread's messages
+    thread_stream = io.StringIO()
+
+    def migrate_in_thread():
+        with migrations.batch_migration_messages(thread_stream):
+            migrations.migrate_profile(old_profile("threaded"))
+
+    main_stream = io.StringIO()
+    with migrations.batch_migration_messages(main_stream):
+        worker = threading.Thread(target=migrate_in_thread)
+        worker.start()
+        worker.join()
+    if main_stream.getvalue() or "'threaded'" not in thread_stream.getvalue():
+        result.error = (
+            f"Thread batches mixed: main={main_stream.getvalue()!r}, "
+            f"thread={thread_stream.getvalue()!r}"
+        )
+        return result
+
+    result.passed = True
+    return result
+
+
+def test_migrate_and_validate_profile(temp_dir: Path) -> TestResult:
+    """Test that migrate_and_validate_profile matches migrate_profile + validate_profile."""
+    result = TestResult("migrate_and_validate_profile")
+
+    old = {"id": "old", "names": {"default": "Old"}, "tags": [1]}
+    current = {"id": "current", "names": {"default": "C"}, "version": 1, "tags": [1]}
+
+    with migrations.batch_migration_messages(io.StringIO()):
+        for profile in (old, current):
+            expected_profile = migrations.migrate_profile(profile)
+            expected = (expected_profile, schemas.validate_profile(expected_profile))
+            got = schemas.migrate_and_validate_profile(profile)
+            if got != expected:
+                result.error = f"{profile['id']}: expected {expected}, got {got}"
+                return result
+
+    if old.get("version") is not None:
+        result.error = "Migration modified the caller's profile"
+        return result
+
+    migrated, _ = schemas.migrate_and_validate_profile(current)
+    if migrated is not current:
+        result.error = "Current-version profile was copied instead of returned as is"
+        return result
+
+    # Non-dict input is reported as a warning, not raised from the migration
+    got = schemas.migrate_and_validate_profile("not a profile")
+    if got[0] != "not a profile" or not got[1]:
+        result.error = f"Non-dict input: unexpected result {got}"
+        return result
+
+    # Non-numeric versions skip migration and are left to the validator
+    for version in ("1", None, True):
+        profile = {"id": "bad", "names": {"default": "B"}, "version": version}
+        try:
+            got = schemas.migrate_and_validate_profile(profile)
+        except TypeError as e:
+            result.error = f"version {version!r}: raised {e}"
+            return result
+        if got != (profile, schemas.validate_profile(profile)):
+            result.error = f"version {version!r}: unexpected result {got}"
+            return result
+        if version == "1" and got[1] != ["Profile 'version' must be an int, got str"]:
+            result.error = f"String version not reported: {got[1]}"
+            return result
+
+    result.passed = True
+    return result
+
+
+def _fake_backend_module(module_name: str) -> types.ModuleType:
+    """A backend module whose Backend records the config it was built with."""
+
+    class FakeBackend(base.EmbeddingBackend):
+        name = module_name
+        requires_api_key = False
+        config_env = ("FAKE_BACKEND_KEY",)
+
+        def __init__(self):
+            self.key = os.environ.get("FAKE_BACKEND_KEY")
+
+        def enroll_speaker(self, audio_path, segments=None):
+            raise NotImplementedError
+
+        def identify_speaker(self, audio_path, candidates, threshold=0.354):
+            raise NotImplementedError
+
+    module = types.ModuleType(module_name)
+    module.Backend = FakeBackend
+    return module
+
+
+def test_backend_cache_reuse_and_invalidation(temp_dir: Path) -> TestResult:
+    """Test that get_backend reuses instances until their configuration changes."""
+    result = TestResult("backend_cache_reuse_and_invalidation")
+
+    modules = [_fake_backend_module(f"fake_backend_{i}_for_tests") for i in (1, 2)]
+    configs = []
+    for module in modules:
+        config_path = temp_dir / f"{module.__name__}.yaml"
+        config_path.write_text(f"backends:\n  fake:\n    module: {module.__name__}\n")
+        configs.append(str(config_path))
+
+    saved_env = {var: os.environ.get(var) for var in ("FAKE_BACKEND_KEY", "SPEAKER_BACKENDS_CONFIG")}
+    sys.modules.update({module.__name__: module for module in modules})
+    try:
+        os.environ["SPEAKER_BACKENDS_CONFIG"] = configs[0]
+        os.environ["FAKE_BACKEND_KEY"] = "key-1"
+        base.reload_backends_config()
+
+        first = base.get_backend("fake")
+        if base.get_backend("fake") is not first:
+            result.error = "Backend was rebuilt with unchanged configuration"
+            return result
+
+        # A variable listed in config_env changes: new instance, then reused
+        os.environ["FAKE_BACKEND_KEY"] = "key-2"
+        second = base.get_backend("fake")
+        if second is first or second.key != "key-2":
+            result.error = "Backend not rebuilt after FAKE_BACKEND_KEY changed"
+            return result
+        if base.get_backend("fake") is not second:
+            result.error = "Rebuilt backend was not reused"
+            return result
+
+        # SPEAKER_BACKENDS_CONFIG maps the name to another module: new instance
+        os.environ["SPEAKER_BACKENDS_CONFIG"] = configs[1]
+        third = base.get_backend("fake")
+        if third.name != modules[1].__name__:
+            result.error = f"Config change not picked up: got {third.name}"
+            return result
+
+        # Back to the first config: not the other module's instance
+        os.environ["SPEAKER_BACKENDS_CONFIG"] = configs[0]
+        fourth = base.get_backend("fake")
+        if fourth.name != modules[0].__name__ or fourth.key != "key-2":
+            result.error = f"Stale backend after switching config back: {fourth.name}"
+            return result
+
+        base.clear_backend_cache()
+        if base.get_backend("fake") is fourth:
+            result.error = "clear_backend_cache() did not drop the instance"
+            return result
+
+    finally:
+        for module in modules:
+            sys.modules.pop(module.__name__, None)
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+        base.reload_backends_config()
+
+    result.passed = True
+    return result
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="speaker_detection CLI unit tests")
@@ -730,6 +1095,13 @@ def main():
         test_identify_error_handling,
         test_verify_error_handling,
         test_embeddings_command,
+        test_validate_checks_stored_profiles,
+        test_validate_all_pooled_matches_serial,
+        test_validate_all_small_input_stays_serial,
+        test_validate_all_quick_mode,
+        test_batch_migration_messages,
+        test_migrate_and_validate_profile,
+        test_backend_cache_reuse_and_invalidation,
     ]
 
     print("speaker_detection CLI Unit Tests")
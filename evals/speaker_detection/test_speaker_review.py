@@ -8,19 +8,53 @@ Note: TUI interactions cannot be tested directly, so we focus on non-interactive
 Usage:
     ./test_speaker_review.py              # Run all tests
     ./test_speaker_review.py -v           # Verbose output
+    ./test_speaker_review.py -j 1         # Run tests sequentially
+    ./test_speaker_review.py --fast       # Skip tests that were slow last run
+    ./test_speaker_review.py --only-changed main  # Run only if relevant files changed
 """
 
 import json
 import os
+import re
 import subprocess
 import sys
 import tempfile
+import time
+import traceback
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 REPO_ROOT = SCRIPT_DIR.parent.parent
 SPEAKER_REVIEW = REPO_ROOT / "speaker-review"
+SPEAKER_REVIEW_STR = str(SPEAKER_REVIEW)  # stringified once for run_cmd
+BASE_ENV = os.environ.copy()  # per-test env vars are layered on top
+
+# Temp files go to tmpfs when available to keep small-file I/O off disk;
+# None falls back to tempfile's default ($TMPDIR or /tmp)
+TMP_BASE = (
+    "/dev/shm"
+    if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else None
+)
+
+# Per-test durations from previous runs (used by --fast and batching);
+# kept in the user cache dir so runs leave the source tree untouched
+TIMES_FILE = Path(os.environ.get(
+    "XDG_CACHE_HOME",
+    os.path.expanduser("~/.cache")
+)) / "speaker-diarization-toolkit" / "speaker_review_times.json"
+SLOW_TEST_SECONDS = 1.0
+
+# Changes to anything outside evals/ (tools, speaker_detection_backends/, ...)
+# can affect these tests, as can this file itself (used by --only-changed)
+TEST_FILE = "evals/speaker_detection/test_speaker_review.py"
+
+# Help output matchers (compiled once, single pass over stdout)
+KEYBINDINGS_PATTERN = re.compile(r"approve|reject|skip|play|quit", re.IGNORECASE)
+SUBCOMMANDS = {"review", "status", "clear"}
+SUBCOMMANDS_PATTERN = re.compile(r"\b(?:review|status|clear)\b")
 
 
 class TestResult:
@@ -32,20 +66,24 @@ class TestResult:
 
 
 def run_cmd(args: list, env: dict = None, stdin_input: str = None) -> tuple:
-    """Run speaker-review command, return (returncode, stdout, stderr)."""
-    cmd = [str(SPEAKER_REVIEW)] + args
-    full_env = os.environ.copy()
-    if env:
-        full_env.update(env)
+    """Run speaker-review command, return (returncode, stdout, stderr).
+
+    Output is captured as bytes and decoded once at the end.
+    """
+    cmd = [SPEAKER_REVIEW_STR, *args]
+    full_env = {**BASE_ENV, **env} if env else BASE_ENV
 
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         env=full_env,
-        input=stdin_input,
+        input=stdin_input.encode() if stdin_input is not None else None,
+    )
+    return (
+        result.returncode,
+        result.stdout.decode("utf-8", "replace"),
+        result.stderr.decode("utf-8", "replace"),
     )
-    return result.returncode, result.stdout, result.stderr
 
 
 def create_test_audio(temp_dir: Path, filename: str = "test_audio.wav", duration: float = 1.0, unique_id: str = None) -> Path:
@@ -104,16 +142,29 @@ def create_test_audio(temp_dir: Path, filename: str = "test_audio.wav", duration
     return audio_path
 
 
+# Hashes keyed by (path, mtime_ns, size) so an unchanged file is hashed once
+_b3sum_cache = {}
+
+
 def compute_b3sum(file_path: Path) -> str:
+    """Compute Blake3 hash of a file, memoized per (path, mtime, size)."""
+    st = os.stat(file_path)
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    b3sum = _b3sum_cache.get(key)
+    if b3sum is None:
+        b3sum = _b3sum_cache[key] = _compute_b3sum_uncached(file_path)
+    return b3sum
+
+
+def _compute_b3sum_uncached(file_path: Path) -> str:
     """Compute Blake3 hash of a file, falling back to SHA256 if b3sum unavailable."""
     try:
         result = subprocess.run(
             ["b3sum", "--no-names", str(file_path)],
             capture_output=True,
-            text=True,
             check=True
         )
-        return result.stdout.strip()[:32]
+        return result.stdout.strip()[:32].decode("ascii")
     except (subprocess.CalledProcessError, FileNotFoundError):
         import hashlib
         sha256 = hashlib.sha256()
@@ -590,14 +641,7 @@ def test_help_output(temp_dir: Path) -> TestResult:
         return result
 
     # Should show keybindings in help
-    keybindings = ["approve", "reject", "skip", "play", "quit"]
-    found_any = False
-    for kb in keybindings:
-        if kb in stdout.lower():
-            found_any = True
-            break
-
-    if not found_any:
+    if not KEYBINDINGS_PATTERN.search(stdout):
         result.error = f"Expected keybindings in help output: {stdout}"
         return result
 
@@ -618,11 +662,7 @@ def test_help_shows_subcommands(temp_dir: Path) -> TestResult:
         return result
 
     # Should show subcommands
-    subcommands = ["review", "status", "clear"]
-    missing = []
-    for cmd in subcommands:
-        if cmd not in stdout:
-            missing.append(cmd)
+    missing = sorted(SUBCOMMANDS - set(SUBCOMMANDS_PATTERN.findall(stdout)))
 
     if missing:
         result.error = f"Missing subcommands in help: {missing}. Output: {stdout}"
@@ -673,7 +713,8 @@ def test_review_subcommand_explicit(temp_dir: Path) -> TestResult:
     rc, stdout, stderr = run_cmd(["review"], env)
 
     # Should not fail with "unknown subcommand" or similar
-    if "invalid choice" in stderr.lower() or "unrecognized" in stderr.lower():
+    stderr_lower = stderr.lower()
+    if "invalid choice" in stderr_lower or "unrecognized" in stderr_lower:
         result.error = f"review subcommand not recognized: {stderr}"
         return result
 
@@ -696,7 +737,8 @@ def test_review_context_option(temp_dir: Path) -> TestResult:
     rc, stdout, stderr = run_cmd(["review", "--context", "team-meeting"], env)
 
     # Should accept the option (may still show "no assignments" but not argument error)
-    if "unrecognized arguments" in stderr.lower() or "invalid" in stderr.lower():
+    stderr_lower = stderr.lower()
+    if "unrecognized arguments" in stderr_lower or "invalid" in stderr_lower:
         result.error = f"--context option not recognized: {stderr}"
         return result
 
@@ -858,10 +900,105 @@ def test_invalid_subcommand(temp_dir: Path) -> TestResult:
 # Main
 # =============================================================================
 
+def load_test_times() -> dict:
+    """Load per-test durations (seconds) recorded by previous runs."""
+    try:
+        with open(TIMES_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_test_times(times: dict):
+    """Persist per-test durations for the next run."""
+    TIMES_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMES_FILE, "w") as f:
+        json.dump(times, f, indent=2, sort_keys=True)
+
+
+def changed_files_since(ref: str) -> set:
+    """Return repo-relative paths changed since a git ref.
+
+    Includes uncommitted edits and untracked files that are not ignored, so
+    a new dependency that was never committed still counts as changed.
+    """
+    changed = set()
+    for cmd in (["git", "diff", "--name-only", ref],
+                ["git", "ls-files", "--others", "--exclude-standard"]):
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            check=True,
+        )
+        changed.update(result.stdout.splitlines())
+    return changed
+
+
+def is_test_dependency(path: str) -> bool:
+    """True if a changed repo-relative path can affect these tests."""
+    return path == TEST_FILE or not path.startswith("evals/")
+
+
+def run_test(test_name: str) -> tuple:
+    """Run one test in a fresh temp directory.
+
+    Executed inside a process pool worker, so the test is looked up by name.
+    Returns (result, exception_text, seconds); exactly one of result and
+    exception_text is None.
+    """
+    test_func = globals()[test_name]
+    temp_dir = Path(tempfile.mkdtemp(prefix="review_test_", dir=TMP_BASE))
+    start = time.perf_counter()
+
+    try:
+        return test_func(temp_dir), None, time.perf_counter() - start
+    except Exception as e:
+        return None, f"{e}\n{traceback.format_exc()}", time.perf_counter() - start
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_batch(test_names: list) -> list:
+    """Run a batch of tests sequentially in one worker.
+
+    Returns a list of (test_name, result, exception_text, seconds) tuples.
+    """
+    return [(name, *run_test(name)) for name in test_names]
+
+
+def plan_batches(test_names: list, times: dict, workers: int) -> list:
+    """Split tests into per-worker batches, longest recorded duration first.
+
+    Greedy LPT scheduling: each test goes to the currently least-loaded
+    batch. Tests with no recorded duration are assumed to take the mean.
+    """
+    known = [times[name] for name in test_names if name in times]
+    default = sum(known) / len(known) if known else SLOW_TEST_SECONDS
+
+    batches = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for name in sorted(test_names, key=lambda n: times.get(n, default), reverse=True):
+        i = min(range(workers), key=loads.__getitem__)
+        batches[i].append(name)
+        loads[i] += times.get(name, default)
+
+    return [batch for batch in batches if batch]
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="speaker-review CLI unit tests")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of parallel test workers (default: CPU count)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Skip tests whose last recorded run exceeded --slow-threshold")
+    parser.add_argument("--slow-threshold", type=float, default=SLOW_TEST_SECONDS, metavar="SECONDS",
+                        help=f"Duration above which --fast skips a test (default: {SLOW_TEST_SECONDS})")
+    parser.add_argument("--only-changed", metavar="GIT_REF",
+                        help="Skip all tests unless a file outside evals/ or this test file changed since GIT_REF")
     args = parser.parse_args()
 
     # Check for pyyaml
@@ -915,36 +1052,74 @@ def main():
     skipped = 0
     results = []
 
-    for test_func in tests:
-        # Create fresh temp directory for each test
-        temp_dir = Path(tempfile.mkdtemp(prefix="review_test_"))
+    # Select tests: --only-changed and --fast skip before anything is spawned
+    times = load_test_times()
+    skip_reasons = {}
 
+    if args.only_changed:
         try:
-            result = test_func(temp_dir)
-            results.append(result)
-
-            if result.skipped:
-                print(f"  SKIP: {result.name}")
-                skipped += 1
-            elif result.passed:
-                print(f"  PASS: {result.name}")
-                passed += 1
-            else:
-                print(f"  FAIL: {result.name}")
-                if args.verbose and result.error:
-                    print(f"        Error: {result.error}")
-                failed += 1
-
-        except Exception as e:
-            print(f"  FAIL: {test_func.__name__} (exception)")
-            if args.verbose:
-                import traceback
-                print(f"        {e}")
-                traceback.print_exc()
-            failed += 1
-
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            changed = changed_files_since(args.only_changed)
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"ERROR: Could not diff against {args.only_changed!r}: {e}")
+            return 2
+        changed_dependencies = sorted(filter(is_test_dependency, changed))
+        if changed_dependencies:
+            print(f"  Changed since {args.only_changed}: {', '.join(changed_dependencies)}")
+        else:
+            reason = f"no changes outside evals/ or to {TEST_FILE} since {args.only_changed}"
+            for test_func in tests:
+                skip_reasons[test_func.__name__] = reason
+
+    if args.fast:
+        for test_func in tests:
+            recorded = times.get(test_func.__name__, 0.0)
+            if recorded > args.slow_threshold:
+                skip_reasons.setdefault(test_func.__name__, f"slow, {recorded:.2f}s last run")
+
+    if skip_reasons:
+        sys.stdout.write("".join(f"  SKIP: {name} ({reason})\n" for name, reason in skip_reasons.items()))
+        skipped += len(skip_reasons)
+
+    to_run = [t.__name__ for t in tests if t.__name__ not in skip_reasons]
+
+    # Each test owns its temp dir and subprocesses, so they run independently.
+    # Tests are packed into one batch per worker so a long test doesn't
+    # leave the pool idle at the tail.
+    workers = max(1, min(args.jobs, len(to_run)))
+    batches = plan_batches(to_run, times, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_batch, batch) for batch in batches]
+
+        for future in as_completed(futures):
+            for test_name, result, exc_text, seconds in future.result():
+                times[test_name] = round(seconds, 3)
+
+                # Buffer each test's report and emit it with a single write
+                out = []
+                if exc_text is not None:
+                    out.append(f"  FAIL: {test_name} (exception)\n")
+                    if args.verbose:
+                        out.append(f"        {exc_text}\n")
+                    failed += 1
+                else:
+                    results.append(result)
+
+                    if result.skipped:
+                        out.append(f"  SKIP: {result.name}\n")
+                        skipped += 1
+                    elif result.passed:
+                        out.append(f"  PASS: {result.name}\n")
+                        passed += 1
+                    else:
+                        out.append(f"  FAIL: {result.name}\n")
+                        if args.verbose and result.error:
+                            out.append(f"        Error: {result.error}\n")
+                        failed += 1
+
+                sys.stdout.write("".join(out))
+
+    save_test_times(times)
 
     print("=" * 40)
     print(f"Results: {passed} passed, {failed} failed, {skipped} skipped")
@@ -2,23 +2,127 @@
 """
 Unit tests for speaker_segments CLI tool.
 
-Tests segment extraction from mock transcripts with various formats.
+Tests segment extraction from mock transcripts with various formats, and
+the transcript library's caching behavior directly.
 
 Usage:
     ./test_speaker_segments.py              # Run all tests
     ./test_speaker_segments.py -v           # Verbose output
+    ./test_speaker_segments.py -j 1         # Run tests sequentially
+    ./test_speaker_segments.py --subprocess # One process per CLI call
 """
 
+import ast
+import csv
+import io
 import json
 import os
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 REPO_ROOT = SCRIPT_DIR.parent.parent
 SPEAKER_SEGMENTS = REPO_ROOT / "speaker_segments"
+SCRIPT_RUNNER = SCRIPT_DIR.parent / "script_runner.py"
+
+# Stringified once; run_cmd builds a request per call
+SPEAKER_SEGMENTS_STR = str(SPEAKER_SEGMENTS)
+SCRIPT_RUNNER_STR = str(SCRIPT_RUNNER)
+
+# Temp files go to tmpfs when available to keep small-file I/O off disk;
+# None falls back to tempfile's default ($TMPDIR or /tmp)
+TMP_BASE = (
+    "/dev/shm"
+    if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else None
+)
+
+# Module-level tests below call the transcript library directly
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(SCRIPT_RUNNER.parent))
+
+from script_runner import run_script_subprocess
+from speaker_detection_backends.transcript import (
+    TranscriptIndex,
+    extract_segments_as_tuples,
+    get_available_speakers,
+    load_transcript,
+)
+
+
+# =============================================================================
+# Mock Transcripts
+# =============================================================================
+# Serialized once at import; tests only write the pre-encoded bytes to disk.
+
+ASSEMBLYAI_TWO_SPEAKERS = json.dumps({
+    "utterances": [
+        {"speaker": "A", "start": 1000, "end": 5000, "text": "Hello"},
+        {"speaker": "B", "start": 6000, "end": 10000, "text": "Hi there"},
+        {"speaker": "A", "start": 11000, "end": 15000, "text": "How are you?"},
+    ]
+}).encode()
+
+ASSEMBLYAI_TUPLES = json.dumps({
+    "utterances": [
+        {"speaker": "A", "start": 2000, "end": 4000, "text": "Test"},
+        {"speaker": "A", "start": 8000, "end": 12000, "text": "More"},
+    ]
+}).encode()
+
+ASSEMBLYAI_SINGLE = json.dumps({
+    "utterances": [
+        {"speaker": "A", "start": 1500, "end": 3500, "text": "Test"},
+    ]
+}).encode()
+
+ASSEMBLYAI_MERGE_GAPS = json.dumps({
+    "utterances": [
+        {"speaker": "A", "start": 1000, "end": 3000, "text": "First"},
+        {"speaker": "A", "start": 3500, "end": 5000, "text": "Second"},  # 0.5s gap
+        {"speaker": "A", "start": 10000, "end": 12000, "text": "Third"},  # 5s gap (not merged)
+    ]
+}).encode()
+
+SPEECHMATICS_TWO_SPEAKERS = json.dumps({
+    "results": [
+        {
+            "type": "word",
+            "start_time": 0.5,
+            "end_time": 1.0,
+            "alternatives": [{"content": "Hello", "speaker": "S1"}],
+        },
+        {
+            "type": "word",
+            "start_time": 1.2,
+            "end_time": 1.8,
+            "alternatives": [{"content": "world", "speaker": "S1"}],
+        },
+        {
+            "type": "word",
+            "start_time": 2.0,
+            "end_time": 2.5,
+            "alternatives": [{"content": "Hi", "speaker": "S2"}],
+        },
+        {
+            "type": "word",
+            "start_time": 3.0,
+            "end_time": 3.5,
+            "alternatives": [{"content": "there", "speaker": "S1"}],
+        },
+    ]
+}).encode()
+
+ASSEMBLYAI_NAMED_SPEAKERS = json.dumps({
+    "utterances": [
+        {"speaker": "Alice", "start": 1000, "end": 5000, "text": "Hello"},
+        {"speaker": "Bob", "start": 6000, "end": 10000, "text": "Hi"},
+        {"speaker": "Alice", "start": 11000, "end": 15000, "text": "Bye"},
+    ]
+}).encode()
 
 
 class TestResult:
@@ -28,35 +132,65 @@ class TestResult:
         self.error = None
 
 
-def run_cmd(args: list, stdin_input: str = None) -> tuple:
-    """Run speaker_segments command, return (returncode, stdout, stderr)."""
-    cmd = [sys.executable, str(SPEAKER_SEGMENTS)] + args
+# One long-lived driver per process (each pool worker starts its own).
+# It exits on EOF when the owning process goes away.
+_driver = None
+
+# Set per worker by run_test(): run each CLI call as its own process
+_use_subprocess = False
+
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        input=stdin_input,
-    )
-    return result.returncode, result.stdout, result.stderr
+def get_driver() -> subprocess.Popen:
+    """Return the persistent test driver, starting it on first use."""
+    global _driver
+    if _driver is None or _driver.poll() is not None:
+        _driver = subprocess.Popen(
+            [sys.executable, SCRIPT_RUNNER_STR],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+    return _driver
+
+
+def run_cmd(args: list, stdin_input: str = None) -> tuple:
+    """Run speaker_segments command, return (returncode, stdout, stderr).
+
+    Requests go to a persistent driver process instead of spawning a fresh
+    interpreter per call; see script_runner.py for the line protocol. With
+    --subprocess, each call runs the tool as its own process instead.
+    """
+    if _use_subprocess:
+        return run_script_subprocess(SPEAKER_SEGMENTS_STR, args, stdin_input)
+
+    driver = get_driver()
+    request = {"script": SPEAKER_SEGMENTS_STR, "args": args, "stdin": stdin_input}
+    driver.stdin.write(json.dumps(request) + "\n")
+    driver.stdin.flush()
+
+    response = driver.stdout.readline()
+    if not response:
+        raise RuntimeError("Test driver exited unexpectedly")
+    rc, stdout, stderr = json.loads(response)
+    return rc, stdout, stderr
+
+
+def write_transcript(blob: bytes) -> str:
+    """Write a pre-serialized transcript to a temp file, return its path."""
+    fd, path = tempfile.mkstemp(suffix=".json", dir=TMP_BASE)
+    try:
+        os.write(fd, blob)
+    finally:
+        os.close(fd)
+    return path
 
 
 def test_json_output_format() -> TestResult:
     """Test JSON output format with mock AssemblyAI transcript."""
     result = TestResult("json_output_format")
 
-    # Create mock AssemblyAI transcript
-    transcript_data = {
-        "utterances": [
-            {"speaker": "A", "start": 1000, "end": 5000, "text": "Hello"},
-            {"speaker": "B", "start": 6000, "end": 10000, "text": "Hi there"},
-            {"speaker": "A", "start": 11000, "end": 15000, "text": "How are you?"},
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(ASSEMBLYAI_TWO_SPEAKERS)
 
     try:
         rc, stdout, stderr = run_cmd([transcript_file, "A", "--format", "json"])
@@ -105,16 +239,7 @@ def test_tuples_output_format() -> TestResult:
     """Test tuples output format."""
     result = TestResult("tuples_output_format")
 
-    transcript_data = {
-        "utterances": [
-            {"speaker": "A", "start": 2000, "end": 4000, "text": "Test"},
-            {"speaker": "A", "start": 8000, "end": 12000, "text": "More"},
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(ASSEMBLYAI_TUPLES)
 
     try:
         rc, stdout, stderr = run_cmd([transcript_file, "A", "--format", "tuples"])
@@ -123,10 +248,16 @@ def test_tuples_output_format() -> TestResult:
             result.error = f"Command failed: {stderr}"
             return result
 
-        # Should be valid Python tuple syntax
-        expected = "[(2.0, 4.0), (8.0, 12.0)]"
-        if stdout.strip() != expected:
-            result.error = f"Tuples format mismatch.\nExpected: {expected}\nGot: {stdout.strip()}"
+        # Should be valid Python tuple syntax; compare parsed values, not text
+        expected = [(2.0, 4.0), (8.0, 12.0)]
+        try:
+            segments = ast.literal_eval(stdout.strip())
+        except (ValueError, SyntaxError) as e:
+            result.error = f"Failed to parse tuples output: {e}\nOutput: {stdout}"
+            return result
+
+        if segments != expected:
+            result.error = f"Tuples format mismatch.\nExpected: {expected}\nGot: {segments}"
             return result
 
         result.passed = True
@@ -141,15 +272,7 @@ def test_csv_output_format() -> TestResult:
     """Test CSV output format."""
     result = TestResult("csv_output_format")
 
-    transcript_data = {
-        "utterances": [
-            {"speaker": "A", "start": 1500, "end": 3500, "text": "Test"},
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(ASSEMBLYAI_SINGLE)
 
     try:
         rc, stdout, stderr = run_cmd([transcript_file, "A", "--format", "csv"])
@@ -158,13 +281,14 @@ def test_csv_output_format() -> TestResult:
             result.error = f"Command failed: {stderr}"
             return result
 
-        lines = stdout.strip().split("\n")
-        if lines[0] != "start,end":
-            result.error = f"CSV header mismatch: {lines[0]}"
+        rows = list(csv.reader(io.StringIO(stdout)))
+        if not rows or rows[0] != ["start", "end"]:
+            result.error = f"CSV header mismatch: {rows[:1]}"
             return result
 
-        if lines[1] != "1.5,3.5":
-            result.error = f"CSV data mismatch: {lines[1]}"
+        data = [tuple(float(v) for v in row) for row in rows[1:]]
+        if data != [(1.5, 3.5)]:
+            result.error = f"CSV data mismatch: {data}"
             return result
 
         result.passed = True
@@ -180,17 +304,7 @@ def test_merge_gap_functionality() -> TestResult:
     result = TestResult("merge_gap_functionality")
 
     # Create transcript with segments that have small gaps
-    transcript_data = {
-        "utterances": [
-            {"speaker": "A", "start": 1000, "end": 3000, "text": "First"},
-            {"speaker": "A", "start": 3500, "end": 5000, "text": "Second"},  # 0.5s gap
-            {"speaker": "A", "start": 10000, "end": 12000, "text": "Third"},  # 5s gap (not merged)
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(ASSEMBLYAI_MERGE_GAPS)
 
     try:
         # Without merge-gap: should get 3 segments
@@ -232,39 +346,7 @@ def test_speechmatics_format() -> TestResult:
     """Test with Speechmatics transcript format."""
     result = TestResult("speechmatics_format")
 
-    # Create mock Speechmatics transcript
-    transcript_data = {
-        "results": [
-            {
-                "type": "word",
-                "start_time": 0.5,
-                "end_time": 1.0,
-                "alternatives": [{"content": "Hello", "speaker": "S1"}],
-            },
-            {
-                "type": "word",
-                "start_time": 1.2,
-                "end_time": 1.8,
-                "alternatives": [{"content": "world", "speaker": "S1"}],
-            },
-            {
-                "type": "word",
-                "start_time": 2.0,
-                "end_time": 2.5,
-                "alternatives": [{"content": "Hi", "speaker": "S2"}],
-            },
-            {
-                "type": "word",
-                "start_time": 3.0,
-                "end_time": 3.5,
-                "alternatives": [{"content": "there", "speaker": "S1"}],
-            },
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(SPEECHMATICS_TWO_SPEAKERS)
 
     try:
         rc, stdout, stderr = run_cmd([transcript_file, "S1", "--format", "json"])
@@ -292,17 +374,7 @@ def test_list_speakers() -> TestResult:
     """Test --list-speakers flag."""
     result = TestResult("list_speakers")
 
-    transcript_data = {
-        "utterances": [
-            {"speaker": "Alice", "start": 1000, "end": 5000, "text": "Hello"},
-            {"speaker": "Bob", "start": 6000, "end": 10000, "text": "Hi"},
-            {"speaker": "Alice", "start": 11000, "end": 15000, "text": "Bye"},
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    transcript_file = write_transcript(ASSEMBLYAI_NAMED_SPEAKERS)
 
     try:
         # Use a dummy speaker label since --list-speakers exits early
@@ -328,15 +400,8 @@ def test_speaker_not_found() -> TestResult:
     """Test error handling for non-existent speaker."""
     result = TestResult("speaker_not_found")
 
-    transcript_data = {
-        "utterances": [
-            {"speaker": "Alice", "start": 1000, "end": 5000, "text": "Hello"},
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(transcript_data, f)
-        transcript_file = f.name
+    # Real speakers are present, so this checks the label lookup itself
+    transcript_file = write_transcript(ASSEMBLYAI_NAMED_SPEAKERS)
 
     try:
         rc, stdout, stderr = run_cmd([transcript_file, "NonExistent"])
@@ -349,6 +414,10 @@ def test_speaker_not_found() -> TestResult:
             result.error = f"Expected 'not found' in error message: {stderr}"
             return result
 
+        if "Available speakers: Alice, Bob" not in stderr:
+            result.error = f"Expected the transcript's speakers in error message: {stderr}"
+            return result
+
         result.passed = True
 
     finally:
@@ -375,11 +444,118 @@ def test_file_not_found() -> TestResult:
     return result
 
 
+def test_mutated_transcript_rescanned() -> TestResult:
+    """Test that editing a transcript dict in place is seen by the next call."""
+    result = TestResult("mutated_transcript_rescanned")
+
+    data = json.loads(ASSEMBLYAI_TWO_SPEAKERS)
+    speakers = get_available_speakers(data)
+    if speakers != ["A", "B"]:
+        result.error = f"Unexpected speakers before edit: {speakers}"
+        return result
+
+    data["utterances"].append({"speaker": "C", "start": 16000, "end": 18000, "text": "Late"})
+    data["utterances"][0]["speaker"] = "C"
+
+    speakers = get_available_speakers(data)
+    if speakers != ["A", "B", "C"]:
+        result.error = f"Edit not picked up by get_available_speakers: {speakers}"
+        return result
+
+    segments = extract_segments_as_tuples(data, "C")
+    if segments != [(1.0, 5.0), (16.0, 18.0)]:
+        result.error = f"Edit not picked up by extract_segments_as_tuples: {segments}"
+        return result
+
+    segments = TranscriptIndex(data).segments_as_tuples("A")
+    if segments != [(11.0, 15.0)]:
+        result.error = f"New index after edit returned stale segments: {segments}"
+        return result
+
+    result.passed = True
+    return result
+
+
+def test_transcript_indexes_independent() -> TestResult:
+    """Test that indexes over different transcripts keep their own results."""
+    result = TestResult("transcript_indexes_independent")
+
+    assemblyai = TranscriptIndex(json.loads(ASSEMBLYAI_TWO_SPEAKERS))
+    speechmatics = TranscriptIndex(json.loads(SPEECHMATICS_TWO_SPEAKERS))
+
+    # Interleave queries, with module-level calls on other data in between
+    checks = [
+        (lambda: assemblyai.speakers(), ["A", "B"]),
+        (lambda: speechmatics.speakers(), ["S1", "S2"]),
+        (lambda: get_available_speakers(json.loads(ASSEMBLYAI_NAMED_SPEAKERS)), ["Alice", "Bob"]),
+        (lambda: assemblyai.segments_as_tuples("A"), [(1.0, 5.0), (11.0, 15.0)]),
+        (lambda: speechmatics.segments_as_tuples("S1"), [(0.5, 1.8), (3.0, 3.5)]),
+        (lambda: assemblyai.format, "assemblyai"),
+        (lambda: speechmatics.format, "speechmatics"),
+        (lambda: assemblyai.segments_as_tuples("S1"), []),
+        (lambda: speechmatics.segments_as_tuples("A"), []),
+    ]
+    for check, expected in checks:
+        got = check()
+        if got != expected:
+            result.error = f"Expected {expected!r}, got {got!r}"
+            return result
+
+    result.passed = True
+    return result
+
+
+def test_load_transcript_fresh_copy() -> TestResult:
+    """Test that editing a loaded transcript does not affect the next load."""
+    result = TestResult("load_transcript_fresh_copy")
+
+    transcript_file = write_transcript(ASSEMBLYAI_TWO_SPEAKERS)
+
+    try:
+        first = load_transcript(Path(transcript_file))
+        first["utterances"][0]["speaker"] = "Z"
+        first["extra"] = True
+
+        second = load_transcript(Path(transcript_file))
+        if second is first:
+            result.error = "load_transcript returned the same object twice"
+            return result
+
+        if second != json.loads(ASSEMBLYAI_TWO_SPEAKERS):
+            result.error = f"Edit to an earlier load leaked into the next one: {second}"
+            return result
+
+        result.passed = True
+
+    finally:
+        os.unlink(transcript_file)
+
+    return result
+
+
+def run_test(test_name: str, use_subprocess: bool = False) -> tuple:
+    """Run one test by name inside a process pool worker.
+
+    Returns (result, exception_text); exactly one of the two is None.
+    """
+    global _use_subprocess
+    _use_subprocess = use_subprocess
+    try:
+        return globals()[test_name](), None
+    except Exception as e:
+        return None, str(e)
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="speaker_segments CLI unit tests")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of parallel test workers (default: CPU count)")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run each CLI call as its own process instead of through "
+                             "the persistent driver (checks shebang and exit codes)")
     args = parser.parse_args()
 
     tests = [
@@ -391,6 +567,9 @@ def main():
         test_list_speakers,
         test_speaker_not_found,
         test_file_not_found,
+        test_mutated_transcript_rescanned,
+        test_transcript_indexes_independent,
+        test_load_transcript_fresh_copy,
     ]
 
     print("speaker_segments CLI Unit Tests")
@@ -400,25 +579,35 @@ def main():
     failed = 0
     results = []
 
-    for test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-
-            if result.passed:
-                print(f"  PASS: {result.name}")
-                passed += 1
-            else:
-                print(f"  FAIL: {result.name}")
-                if args.verbose and result.error:
-                    print(f"        Error: {result.error}")
+    # Each test writes and removes its own transcript files, so tests run
+    # independently under any multiprocessing start method
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = {executor.submit(run_test, t.__name__, args.subprocess): t for t in tests}
+
+        for future in as_completed(futures):
+            test_func = futures[future]
+            result, exc_text = future.result()
+
+            # Buffer each test's report and emit it with a single write
+            out = []
+            if exc_text is not None:
+                out.append(f"  FAIL: {test_func.__name__} (exception)\n")
+                if args.verbose:
+                    out.append(f"        Exception: {exc_text}\n")
                 failed += 1
-
-        except Exception as e:
-            print(f"  FAIL: {test_func.__name__} (exception)")
-            if args.verbose:
-                print(f"        Exception: {e}")
-            failed += 1
+            else:
+                results.append(result)
+
+                if result.passed:
+                    out.append(f"  PASS: {result.name}\n")
+                    passed += 1
+                else:
+                    out.append(f"  FAIL: {result.name}\n")
+                    if args.verbose and result.error:
+                        out.append(f"        Error: {result.error}\n")
+                    failed += 1
+
+            sys.stdout.write("".join(out))
 
     print("=" * 40)
     print(f"Results: {passed} passed, {failed} failed")
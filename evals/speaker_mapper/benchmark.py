@@ -10,26 +10,162 @@ Usage:
 """
 
 import argparse
+import asyncio
+import io
+import itertools
 import json
+import multiprocessing
+import os
+import queue
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+MAPPER_TIMEOUT_SEC = 60
+
+# Shared in-process runner and persistent driver (evals/script_runner.py)
+SCRIPT_RUNNER = Path(__file__).resolve().parent.parent / "script_runner.py"
+sys.path.insert(0, str(SCRIPT_RUNNER.parent))
+
+from script_runner import run_script
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class MapperWorker:
+    """Long-lived script_runner process serving mapper runs."""
+
+    def __init__(self, script_path: Path):
+        self.script_path = str(script_path)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(SCRIPT_RUNNER)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def run(self, args: List[str], timeout: float) -> Tuple[int, str, str]:
+        """Run the mapper with args, return (returncode, stdout, stderr)."""
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            self.proc.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        try:
+            request = {"script": self.script_path, "args": args}
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+            line = self.proc.stdout.readline()
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            self.proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        if not line:
+            raise RuntimeError("Mapper worker exited unexpectedly")
+
+        returncode, stdout, stderr = json_loads(line)
+        return returncode, stdout, stderr
+
+    def close(self):
+        """Send EOF and wait for the worker to exit."""
+        if self.alive():
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
 
 
 class BenchmarkRunner:
     """Runs benchmark tests for speaker mapper."""
 
-    def __init__(self, script_path: str, tests_dir: str, references_dir: str):
+    def __init__(self, script_path: str, tests_dir: str, references_dir: str, concurrency: int = 1,
+                 persistent_workers: bool = False, pool: str = "thread", in_process: bool = False):
         self.script_path = Path(script_path)
         self.tests_dir = Path(tests_dir)
         self.references_dir = Path(references_dir)
+        # run_script() redirects the process-wide stdout/stderr and enforces
+        # its timeout with SIGALRM, so in-process runs go one at a time on the
+        # calling (main) thread
+        self.concurrency = 1 if in_process else max(1, concurrency)
+        self.persistent_workers = persistent_workers
+        self.pool = pool
+        self.in_process = in_process
         self.results = []
+        # Wall-clock duration of the last run_all_tests() call
+        self.wall_time_sec: Optional[float] = None
+        # Stems with a reference file; filled by discover_tests()
+        self._reference_stems: Optional[Set[str]] = None
+        # Parsed references keyed by path, tagged with the file's mtime
+        self._ref_cache: Dict[Path, Tuple[int, Dict]] = {}
+        self._print_lock = threading.Lock()
+        # Idle workers; at most `concurrency` are ever started
+        self._workers: "queue.Queue[MapperWorker]" = queue.Queue()
+
+    def close(self):
+        """Shut down any persistent mapper workers."""
+        while True:
+            try:
+                self._workers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _run_in_worker(self, args: List[str]) -> Tuple[int, str, str]:
+        """Run the mapper on an idle persistent worker, starting one if none is free."""
+        try:
+            worker = self._workers.get_nowait()
+        except queue.Empty:
+            worker = MapperWorker(self.script_path)
+
+        try:
+            return worker.run(args, MAPPER_TIMEOUT_SEC)
+        finally:
+            if worker.alive():
+                self._workers.put(worker)
+
+    def log(self, message: str):
+        """Print a progress message to stderr without interleaving across threads."""
+        with self._print_lock:
+            print(message, file=sys.stderr)
+
+    def _scan_reference_stems(self) -> Set[str]:
+        """Collect the test stems that have a reference file, in one directory scan."""
+        suffix = ".ref.json"
+        try:
+            with os.scandir(self.references_dir) as entries:
+                return {e.name[:-len(suffix)] for e in entries if e.name.endswith(suffix)}
+        except FileNotFoundError:
+            return set()
 
     def discover_tests(self, test_filter: Optional[List[str]] = None) -> List[Path]:
         """Discover all test files in tests directory."""
-        all_tests = sorted(self.tests_dir.glob("*.json"))
+        with os.scandir(self.tests_dir) as entries:
+            all_tests = sorted(self.tests_dir / e.name for e in entries if e.name.endswith(".json"))
+        self._reference_stems = self._scan_reference_stems()
 
         if test_filter:
             # Filter by test IDs (e.g., ["001", "002"])
@@ -44,51 +180,111 @@ class BenchmarkRunner:
 
     def load_reference(self, test_file: Path) -> Dict:
         """Load reference answer for a test."""
+        if self._reference_stems is None:
+            self._reference_stems = self._scan_reference_stems()
+        if test_file.stem not in self._reference_stems:
+            return None
+
         ref_file = self.references_dir / f"{test_file.stem}.ref.json"
-        if not ref_file.exists():
+        try:
+            f = open(ref_file, 'rb')
+        except FileNotFoundError:
             return None
 
-        with open(ref_file, 'r') as f:
-            return json.load(f)
+        with f:
+            # mtime of the file actually opened, so a concurrent replace can't mismatch
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
 
-    def run_mapper(self, test_file: Path, llm_args: List[str]) -> Tuple[Dict, float, Optional[str]]:
-        """
-        Run speaker mapper on test file.
+            # Reuse the parsed reference across runs until the file changes
+            cached = self._ref_cache.get(ref_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
 
-        Returns:
-            (result_dict, execution_time, error_message)
-        """
-        cmd = [
+            reference = json_loads(f.read())
+
+        self._ref_cache[ref_file] = (mtime_ns, reference)
+        return reference
+
+    def _mapper_cmd(self, test_file: Path, llm_args: List[str]) -> List[str]:
+        """Build the mapper command line for a test file."""
+        return [
             str(self.script_path),
             "--stdout-only",
             *llm_args,
             str(test_file)
         ]
 
-        start_time = time.time()
+    @staticmethod
+    def _mapper_outcome(returncode: int, stdout, stderr, elapsed: float) -> Tuple[Dict, float, Optional[str]]:
+        """Turn a finished mapper run into (result_dict, execution_time, error_message)."""
+        if returncode != 0:
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", errors="replace")
+            return None, elapsed, f"Exit code {returncode}: {stderr}"
+
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            elapsed = time.time() - start_time
+            return json_loads(stdout), elapsed, None
+        except json.JSONDecodeError as e:
+            return None, elapsed, f"JSON decode error: {e}"
+
+    def run_mapper(self, test_file: Path, llm_args: List[str]) -> Tuple[Dict, float, Optional[str]]:
+        """
+        Run speaker mapper on test file.
 
-            if result.returncode != 0:
-                return None, elapsed, f"Exit code {result.returncode}: {result.stderr}"
+        Returns:
+            (result_dict, execution_time, error_message)
+        """
+        cmd = self._mapper_cmd(test_file, llm_args)
 
-            output = json.loads(result.stdout)
-            return output, elapsed, None
+        start_time = time.perf_counter()
+        try:
+            if self.in_process:
+                returncode, stdout, stderr = run_script(str(self.script_path), cmd[1:],
+                                                        timeout=MAPPER_TIMEOUT_SEC)
+            elif self.persistent_workers:
+                returncode, stdout, stderr = self._run_in_worker(cmd[1:])
+            else:
+                # Capture bytes: json_loads() parses stdout directly and
+                # stderr is only decoded when it ends up in an error message
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    timeout=MAPPER_TIMEOUT_SEC
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+            elapsed = time.perf_counter() - start_time
+            return self._mapper_outcome(returncode, stdout, stderr, elapsed)
 
         except subprocess.TimeoutExpired:
-            elapsed = time.time() - start_time
-            return None, elapsed, "Timeout (>60s)"
-        except json.JSONDecodeError as e:
-            elapsed = time.time() - start_time
-            return None, elapsed, f"JSON decode error: {e}"
+            elapsed = time.perf_counter() - start_time
+            return None, elapsed, f"Timeout (>{MAPPER_TIMEOUT_SEC}s)"
+        except Exception as e:
+            elapsed = time.perf_counter() - start_time
+            return None, elapsed, f"Error: {e}"
+
+    async def run_mapper_async(self, test_file: Path, llm_args: List[str]) -> Tuple[Dict, float, Optional[str]]:
+        """Run speaker mapper on test file as an asyncio subprocess (see run_mapper)."""
+        cmd = self._mapper_cmd(test_file, llm_args)
+
+        start_time = time.perf_counter()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), MAPPER_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                elapsed = time.perf_counter() - start_time
+                return None, elapsed, f"Timeout (>{MAPPER_TIMEOUT_SEC}s)"
+            elapsed = time.perf_counter() - start_time
+            return self._mapper_outcome(proc.returncode, stdout, stderr, elapsed)
+
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             return None, elapsed, f"Error: {e}"
 
     def score_mapping(self, actual: str, expected_config: Dict) -> Tuple[float, str]:
@@ -98,20 +294,21 @@ class BenchmarkRunner:
         Returns:
             (score, match_type)
         """
-        acceptable = expected_config.get("acceptable", [])
-        preferred = expected_config.get("preferred", "")
-
-        # Exact match with preferred
-        if actual == preferred:
+        # Exact match with preferred (checked before looking up variants)
+        if actual == expected_config.get("preferred", ""):
             return 1.0, "exact"
 
+        acceptable = expected_config.get("acceptable", [])
+
         # Match with acceptable variant
         if actual in acceptable:
             return 1.0, "acceptable"
 
         # Partial match (substring)
+        actual_lower = actual.lower()
         for variant in acceptable:
-            if variant.lower() in actual.lower() or actual.lower() in variant.lower():
+            variant_lower = variant.lower()
+            if variant_lower in actual_lower or actual_lower in variant_lower:
                 return 0.5, "partial"
 
         # No match
@@ -130,10 +327,11 @@ class BenchmarkRunner:
         speaker_scores = {}
         total_score = 0.0
         max_score = 0.0
+        score_mapping = self.score_mapping
 
         for speaker, expected_config in expected_mappings.items():
             actual_name = mappings.get(speaker, "")
-            score, match_type = self.score_mapping(actual_name, expected_config)
+            score, match_type = score_mapping(actual_name, expected_config)
 
             speaker_scores[speaker] = {
                 "actual": actual_name,
@@ -158,18 +356,34 @@ class BenchmarkRunner:
 
     def run_test(self, test_file: Path, llm_args: List[str]) -> Dict:
         """Run a single test and return results."""
-        test_id = test_file.stem
         reference = self.load_reference(test_file)
-
         if not reference:
-            return {
-                "test": test_id,
-                "status": "error",
-                "error": "No reference file found"
-            }
+            return self._missing_reference_result(test_file)
 
         # Run mapper
-        result, elapsed, error = self.run_mapper(test_file, llm_args)
+        return self._test_result(test_file, reference, self.run_mapper(test_file, llm_args))
+
+    async def run_test_async(self, test_file: Path, llm_args: List[str]) -> Dict:
+        """Run a single test with run_mapper_async and return results."""
+        reference = self.load_reference(test_file)
+        if not reference:
+            return self._missing_reference_result(test_file)
+
+        return self._test_result(test_file, reference, await self.run_mapper_async(test_file, llm_args))
+
+    @staticmethod
+    def _missing_reference_result(test_file: Path) -> Dict:
+        return {
+            "test": test_file.stem,
+            "status": "error",
+            "error": "No reference file found"
+        }
+
+    def _test_result(self, test_file: Path, reference: Dict,
+                     mapper_run: Tuple[Dict, float, Optional[str]]) -> Dict:
+        """Build the result record for a test from its mapper run."""
+        test_id = test_file.stem
+        result, elapsed, error = mapper_run
 
         if error:
             return {
@@ -194,32 +408,87 @@ class BenchmarkRunner:
         }
 
     def run_all_tests(self, llm_args: List[str], test_filter: Optional[List[str]] = None) -> List[Dict]:
-        """Run all tests and return results."""
+        """
+        Run all tests and return results in discovery order.
+
+        Tests are independent and bound by LLM latency, so up to
+        `concurrency` mapper subprocesses run at once on a thread pool.
+        With pool="process" tests are spread over a multiprocessing pool
+        instead, which also parallelizes the runner's own work (scoring,
+        JSON parsing) when the mapper is CPU-bound on a local model.
+        pool="async" drives the subprocesses from one asyncio event loop.
+        In-process runs go one at a time on the calling thread.
+        """
         tests = self.discover_tests(test_filter)
-        results = []
-
-        for test_file in tests:
-            print(f"Running {test_file.stem}...", file=sys.stderr)
-            result = self.run_test(test_file, llm_args)
-            results.append(result)
+        results = [None] * len(tests)
+
+        def run_one(test_file: Path) -> Dict:
+            self.log(f"Running {test_file.stem}...")
+            return self.run_test(test_file, llm_args)
+
+        start_ns = time.monotonic_ns()
+        if self.pool == "async" and not (self.in_process or self.persistent_workers):
+            results = asyncio.run(self._run_tests_async(tests, llm_args))
+        elif self.in_process:
+            results = [run_one(test_file) for test_file in tests]
+        elif self.pool == "process" and self.concurrency > 1:
+            initargs = (self.script_path, self.tests_dir, self.references_dir, self.persistent_workers)
+            with multiprocessing.Pool(self.concurrency, _init_process_runner, initargs) as pool:
+                # imap keeps discovery order
+                results = list(pool.imap(_run_test_in_process, [(t, llm_args) for t in tests]))
+                pool.close()
+                pool.join()
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = {executor.submit(run_one, test_file): i for i, test_file in enumerate(tests)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        self.wall_time_sec = (time.monotonic_ns() - start_ns) / 1e9
 
         return results
 
-    def calculate_summary(self, results: List[Dict]) -> Dict:
-        """Calculate summary statistics from results."""
-        total = len(results)
-        passed = sum(1 for r in results if r.get("status") == "pass")
-        failed = sum(1 for r in results if r.get("status") == "fail")
-        errors = sum(1 for r in results if r.get("status") == "error")
+    async def _run_tests_async(self, tests: List[Path], llm_args: List[str]) -> List[Dict]:
+        """Run tests as asyncio subprocesses, at most `concurrency` at a time."""
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-        accuracies = [r.get("accuracy", 0) for r in results if "accuracy" in r]
-        avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
+        async def run_one(test_file: Path) -> Dict:
+            async with semaphore:
+                self.log(f"Running {test_file.stem}...")
+                return await self.run_test_async(test_file, llm_args)
 
-        times = [r.get("time_sec", 0) for r in results if "time_sec" in r]
-        avg_time = sum(times) / len(times) if times else 0
-        total_time = sum(times)
+        # gather keeps discovery order
+        return await asyncio.gather(*(run_one(test_file) for test_file in tests))
 
-        return {
+    def calculate_summary(self, results: List[Dict]) -> Dict:
+        """Calculate summary statistics from results."""
+        total = len(results)
+        passed = failed = errors = 0
+        accuracy_sum = 0
+        accuracy_count = 0
+        total_time = 0
+        time_count = 0
+
+        # Single pass over results
+        for r in results:
+            status = r.get("status")
+            if status == "pass":
+                passed += 1
+            elif status == "fail":
+                failed += 1
+            elif status == "error":
+                errors += 1
+
+            if "accuracy" in r:
+                accuracy_sum += r["accuracy"]
+                accuracy_count += 1
+            if "time_sec" in r:
+                total_time += r["time_sec"]
+                time_count += 1
+
+        avg_accuracy = accuracy_sum / accuracy_count if accuracy_count else 0
+        avg_time = total_time / time_count if time_count else 0
+
+        summary = {
             "total": total,
             "passed": passed,
             "failed": failed,
@@ -229,41 +498,90 @@ class BenchmarkRunner:
             "avg_time_sec": round(avg_time, 2),
             "total_time_sec": round(total_time, 2)
         }
+        # Sum of per-test times overstates the run length when tests run concurrently
+        if self.wall_time_sec is not None:
+            summary["wall_time_sec"] = round(self.wall_time_sec, 2)
 
+        return summary
 
-def output_jsonl(results: List[Dict], summary: Dict, file_path: Optional[str] = None):
-    """Output results in JSONL format."""
-    lines = []
-    for result in results:
-        lines.append(json.dumps(result))
-    lines.append(json.dumps({"summary": summary}))
 
-    output_text = '\n'.join(lines) + '\n'
+# Per-process runner for pool="process"; set by the pool initializer
+_process_runner: Optional[BenchmarkRunner] = None
+
+
+def _init_process_runner(script_path: Path, tests_dir: Path, references_dir: Path,
+                         persistent_workers: bool):
+    """Pool initializer: build the runner each worker process reuses for its tests."""
+    global _process_runner
+    _process_runner = BenchmarkRunner(script_path, tests_dir, references_dir,
+                                      persistent_workers=persistent_workers)
+    # Persistent mapper workers exit on EOF once this process goes away
+
+
+def _run_test_in_process(job: Tuple[Path, List[str]]) -> Dict:
+    """Run one test in a pool worker process."""
+    test_file, llm_args = job
+    _process_runner.log(f"Running {test_file.stem}...")
+    return _process_runner.run_test(test_file, llm_args)
+
+
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB, one write syscall for typical result files
+
 
+def open_output(file_path: str):
+    """Open an output file for writing through a large buffer."""
+    return open(file_path, 'w', buffering=OUTPUT_BUFFER_SIZE)
+
+
+def write_output(output_text: str, file_path: Optional[str] = None):
+    """Write rendered output to a file, or to stdout if no path is given."""
     if file_path:
         # Write to file
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
+        with open_output(file_path) as f:
             f.write(output_text)
     else:
         # Write to stdout
         print(output_text, end='')
 
 
-def output_ascii(results: List[Dict], summary: Dict, llm_args: List[str], file_path: Optional[str] = None):
-    """Output results in human-readable ASCII table format."""
-    lines = []
+def write_jsonl(results: List[Dict], summary: Dict, streams: List):
+    """Stream results plus a trailing summary record as JSONL, one line at a time."""
+    for record in itertools.chain(results, ({"summary": summary},)):
+        line = json.dumps(record) + '\n'
+        for stream in streams:
+            stream.write(line)
+
+
+def output_jsonl(results: List[Dict], summary: Dict, file_path: Optional[str] = None,
+                 echo_stdout: bool = False):
+    """
+    Output results in JSONL format.
+
+    Writes to file_path if given (and also to stdout when echo_stdout is
+    set, serializing each record only once), otherwise to stdout.
+    """
+    if not file_path:
+        write_jsonl(results, summary, [sys.stdout])
+        return
+
+    with open_output(file_path) as f:
+        write_jsonl(results, summary, [f, sys.stdout] if echo_stdout else [f])
+
+
+def render_ascii(results: List[Dict], summary: Dict, llm_args: List[str]) -> str:
+    """Render results as a human-readable ASCII table."""
+    out = io.StringIO()
 
     # Header
-    lines.append("╔══════════════════════════════════════════════════════════════════════════╗")
-    lines.append("║           Speaker Mapper Benchmark Results                              ║")
-    lines.append(f"║  LLM Args: {' '.join(llm_args):<58}║")
-    lines.append("╚══════════════════════════════════════════════════════════════════════════╝")
-    lines.append("")
+    out.write("╔══════════════════════════════════════════════════════════════════════════╗\n")
+    out.write("║           Speaker Mapper Benchmark Results                              ║\n")
+    out.write(f"║  LLM Args: {' '.join(llm_args):<58}║\n")
+    out.write("╚══════════════════════════════════════════════════════════════════════════╝\n")
+    out.write("\n")
 
     # Results table
-    lines.append("TEST                         STATUS    ACCURACY  TIME    DETAILS")
-    lines.append("────────────────────────────────────────────────────────────────────────────")
+    out.write("TEST                         STATUS    ACCURACY  TIME    DETAILS\n")
+    out.write("────────────────────────────────────────────────────────────────────────────\n")
 
     for result in results:
         test = result.get("test", "")
@@ -292,40 +610,36 @@ def output_ascii(results: List[Dict], summary: Dict, llm_args: List[str], file_p
         if status == "error":
             details_str = result.get("error", "Unknown error")[:40]
 
-        lines.append(f"{test:<28} {status_str:<9} {accuracy:>5.1f}%  {time_sec:>5.1f}s  {details_str}")
+        out.write(f"{test:<28} {status_str:<9} {accuracy:>5.1f}%  {time_sec:>5.1f}s  {details_str}\n")
 
-    lines.append("────────────────────────────────────────────────────────────────────────────")
-    lines.append("")
+    out.write("────────────────────────────────────────────────────────────────────────────\n")
+    out.write("\n")
 
     # Summary
-    lines.append("SUMMARY")
-    lines.append("════════════════════════════════════════════════════════════════════════════")
-    lines.append(f"  Total Tests:      {summary['total']}")
-    lines.append(f"  Passed:           {summary['passed']} ({summary['pass_rate']*100:.1f}%)")
-    lines.append(f"  Failed:           {summary['failed']} ({summary['failed']/summary['total']*100:.1f}%)")
+    out.write("SUMMARY\n")
+    out.write("════════════════════════════════════════════════════════════════════════════\n")
+    out.write(f"  Total Tests:      {summary['total']}\n")
+    out.write(f"  Passed:           {summary['passed']} ({summary['pass_rate']*100:.1f}%)\n")
+    out.write(f"  Failed:           {summary['failed']} ({summary['failed']/summary['total']*100:.1f}%)\n")
     if summary['errors'] > 0:
-        lines.append(f"  Errors:           {summary['errors']}")
-    lines.append(f"  Avg Accuracy:     {summary['avg_accuracy']*100:.1f}%")
-    lines.append(f"  Avg Time:         {summary['avg_time_sec']:.2f}s")
-    lines.append(f"  Total Time:       {summary['total_time_sec']:.2f}s")
-    lines.append("════════════════════════════════════════════════════════════════════════════")
+        out.write(f"  Errors:           {summary['errors']}\n")
+    out.write(f"  Avg Accuracy:     {summary['avg_accuracy']*100:.1f}%\n")
+    out.write(f"  Avg Time:         {summary['avg_time_sec']:.2f}s\n")
+    out.write(f"  Total Time:       {summary['total_time_sec']:.2f}s\n")
+    if 'wall_time_sec' in summary:
+        out.write(f"  Wall Time:        {summary['wall_time_sec']:.2f}s\n")
+    out.write("════════════════════════════════════════════════════════════════════════════\n")
 
-    output_text = '\n'.join(lines) + '\n'
+    return out.getvalue()
 
-    if file_path:
-        # Write to file
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(output_text)
-    else:
-        # Write to stdout
-        print(output_text, end='')
+
+def output_ascii(results: List[Dict], summary: Dict, llm_args: List[str], file_path: Optional[str] = None):
+    """Output results in human-readable ASCII table format."""
+    write_output(render_ascii(results, summary, llm_args), file_path)
 
 
 def save_command_script(file_path: str, argv: List[str]):
     """Save the command used to run the benchmark as a shell script."""
-    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-
     # Build the command line
     cmd_line = ' '.join(argv)
 
@@ -361,6 +675,21 @@ Examples:
   # Run specific tests only
   ./benchmark.py --llm-detect gemini --tests 001,002,003
 
+  # Run 4 tests concurrently
+  ./benchmark.py --llm-detect 4o-mini -c 4
+
+  # Reuse long-lived mapper processes instead of one per test
+  ./benchmark.py --llm-detect 4o-mini -c 4 --persistent-workers
+
+  # Run the mapper inside the benchmark process (debugging, profiling)
+  ./benchmark.py --llm-detect 4o-mini --in-process
+
+  # Drive 8 concurrent mapper subprocesses from one asyncio event loop
+  ./benchmark.py --llm-detect 4o-mini -c 8 --pool async
+
+  # Spread tests over 4 worker processes (local, CPU-bound models)
+  ./benchmark.py --llm-detect smollm2:360m --llm-endpoint http://localhost:11434/v1 -c 4 --pool process
+
   # Verbose mode
   ./benchmark.py --llm-detect 4o-mini -v --output ascii
         """
@@ -387,6 +716,30 @@ Examples:
         "--tests",
         help="Comma-separated test IDs to run (e.g., 001,002,003)"
     )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of tests to run concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--pool",
+        choices=["thread", "process", "async"],
+        default="thread",
+        help="Run concurrent tests on threads, separate worker processes, or an asyncio "
+             "event loop (default: thread)"
+    )
+    parser.add_argument(
+        "--persistent-workers",
+        action="store_true",
+        help="Run the mapper in long-lived worker processes instead of one process per test"
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run the mapper inside the benchmark process (one test at a time)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -433,15 +786,30 @@ Examples:
     references_dir = script_dir / "references"
 
     # Run benchmark
-    runner = BenchmarkRunner(script_path, tests_dir, references_dir)
-    results = runner.run_all_tests(llm_args, test_filter)
+    runner = BenchmarkRunner(script_path, tests_dir, references_dir, concurrency=args.concurrency,
+                             persistent_workers=args.persistent_workers, pool=args.pool,
+                             in_process=args.in_process)
+    try:
+        results = runner.run_all_tests(llm_args, test_filter)
+    finally:
+        runner.close()
     summary = runner.calculate_summary(results)
 
-    # Save to files if requested
+    # Create each output directory once; the writers below assume it exists
+    for parent in {Path(p).parent for p in (args.save_jsonl, args.save_ascii) if p}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    # Save to files if requested; JSONL stdout output is streamed alongside
+    # the saved file so each record is serialized once
     if args.save_jsonl:
-        output_jsonl(results, summary, args.save_jsonl)
+        output_jsonl(results, summary, args.save_jsonl, echo_stdout=args.output == "jsonl")
+
+    # Render the ASCII report once when it goes to both a file and stdout
+    ascii_text = None
+    if args.save_ascii or args.output == "ascii":
+        ascii_text = render_ascii(results, summary, llm_args)
     if args.save_ascii:
-        output_ascii(results, summary, llm_args, args.save_ascii)
+        write_output(ascii_text, args.save_ascii)
 
     # Generate command script if saving to files
     if args.save_jsonl or args.save_ascii:
@@ -452,9 +820,10 @@ Examples:
 
     # Output to stdout (default behavior)
     if args.output == "jsonl":
-        output_jsonl(results, summary)
+        if not args.save_jsonl:
+            output_jsonl(results, summary)
     else:
-        output_ascii(results, summary, llm_args)
+        write_output(ascii_text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for benchmark.py execution modes.
+
+Runs BenchmarkRunner against stub mapper scripts (no LLM calls) and checks
+that the default, --persistent-workers and --in-process modes produce the
+same results, including when a mapper run times out.
+
+Usage:
+    ./test_benchmark.py              # Run all tests
+    ./test_benchmark.py -v           # Verbose output
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+TESTS_DIR = SCRIPT_DIR / "tests"
+REFERENCES_DIR = SCRIPT_DIR / "references"
+
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import benchmark
+
+# Echoes its arguments and the test's top-level keys; fails on test 004
+STUB_MAPPER = '''#!/usr/bin/env python3
+import json
+import sys
+
+test_file = sys.argv[-1]
+if "004" in test_file:
+    print("stub: refusing " + test_file, file=sys.stderr)
+    sys.exit(2)
+with open(test_file) as f:
+    data = json.load(f)
+print(json.dumps({"args": sys.argv[1:-1], "keys": sorted(data)}))
+'''
+
+# Writes to the real stdout in ways sys.stdout redirection does not catch
+NOISY_MAPPER = '''#!/usr/bin/env python3
+import json
+import os
+import subprocess
+import sys
+
+print("stray: sys.__stdout__", file=sys.__stdout__, flush=True)
+os.write(1, b"stray: fd 1\\n")
+subprocess.run([sys.executable, "-c", "print('stray: child process')"])
+print(json.dumps({"test": os.path.basename(sys.argv[-1])}))
+'''
+
+# Hangs on test 002 until the benchmark's timeout interrupts it
+SLOW_MAPPER = '''#!/usr/bin/env python3
+import json
+import os
+import sys
+import time
+
+if "002" in sys.argv[-1]:
+    try:
+        time.sleep(30)
+    except Exception:
+        pass  # must not be able to swallow the timeout
+print(json.dumps({"test": os.path.basename(sys.argv[-1])}))
+'''
+
+LLM_ARGS = ["--llm-detect", "stub-model"]
+
+
+class TestResult:
+    def __init__(self, name: str):
+        self.name = name
+        self.passed = False
+        self.error = None
+
+
+def write_mapper(temp_dir: Path, source: str) -> Path:
+    """Write an executable stub mapper script, return its path."""
+    path = temp_dir / "mapper.py"
+    path.write_text(source)
+    path.chmod(0o755)
+    return path
+
+
+def run_mode(mapper: Path, **mode) -> list:
+    """Run the stub mapper on every test file, return [(result, error), ...]."""
+    runner = benchmark.BenchmarkRunner(mapper, TESTS_DIR, REFERENCES_DIR, **mode)
+    try:
+        outcomes = []
+        for test_file in runner.discover_tests():
+            result, _, error = runner.run_mapper(test_file, LLM_ARGS)
+            outcomes.append((result, error))
+        return outcomes
+    finally:
+        runner.close()
+
+
+def test_modes_match_default(temp_dir: Path) -> TestResult:
+    """Test that persistent-worker and in-process runs match one process per test."""
+    result = TestResult("modes_match_default")
+
+    mapper = write_mapper(temp_dir, STUB_MAPPER)
+    default = run_mode(mapper)
+
+    if not default or all(error for _, error in default):
+        result.error = f"Default mode produced no results: {default}"
+        return result
+    if not any(error for _, error in default):
+        result.error = "Expected the stub to fail on test 004"
+        return result
+
+    for mode in ({"persistent_workers": True}, {"persistent_workers": True, "concurrency": 2},
+                 {"in_process": True}):
+        outcomes = run_mode(mapper, **mode)
+        if outcomes != default:
+            mismatches = [(d, o) for d, o in zip(default, outcomes) if d != o]
+            result.error = f"{mode} differs from default mode: {mismatches[:2]}"
+            return result
+
+    result.passed = True
+    return result
+
+
+def test_persistent_worker_ignores_stray_stdout(temp_dir: Path) -> TestResult:
+    """Test that output bypassing stdout redirection does not break worker responses."""
+    result = TestResult("persistent_worker_ignores_stray_stdout")
+
+    mapper = write_mapper(temp_dir, NOISY_MAPPER)
+
+    # Workers inherit our stderr; capture it to check where the noise went
+    stderr_log = temp_dir / "stderr.log"
+    sys.stderr.flush()
+    saved_stderr = os.dup(2)
+    runner = None
+    try:
+        with open(stderr_log, "wb") as log:
+            os.dup2(log.fileno(), 2)
+        runner = benchmark.BenchmarkRunner(mapper, TESTS_DIR, REFERENCES_DIR, persistent_workers=True)
+        # Several runs on the same worker: a corrupted response would
+        # desynchronize every later one
+        for test_file in runner.discover_tests():
+            mapped, _, error = runner.run_mapper(test_file, LLM_ARGS)
+            if error or mapped != {"test": test_file.name}:
+                result.error = f"{test_file.name}: got {mapped!r}, error {error!r}"
+                return result
+    finally:
+        if runner is not None:
+            runner.close()
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stderr)
+
+    noise = stderr_log.read_text()
+    for line in ("stray: sys.__stdout__", "stray: fd 1", "stray: child process"):
+        if line not in noise:
+            result.error = f"Expected {line!r} on the worker's stderr, got: {noise!r}"
+            return result
+
+    result.passed = True
+    return result
+
+
+def test_in_process_timeout(temp_dir: Path) -> TestResult:
+    """Test that --in-process enforces the mapper timeout like the default mode."""
+    result = TestResult("in_process_timeout")
+
+    mapper = write_mapper(temp_dir, SLOW_MAPPER)
+    saved_timeout = benchmark.MAPPER_TIMEOUT_SEC
+    benchmark.MAPPER_TIMEOUT_SEC = 0.5
+    try:
+        default = run_mode(mapper)
+        start = time.perf_counter()
+        in_process = run_mode(mapper, in_process=True)
+        elapsed = time.perf_counter() - start
+    finally:
+        benchmark.MAPPER_TIMEOUT_SEC = saved_timeout
+
+    timeouts = [error for _, error in in_process if error]
+    if timeouts != ["Timeout (>0.5s)"]:
+        result.error = f"Expected one timeout in-process, got errors: {timeouts}"
+        return result
+
+    if elapsed > 10:
+        result.error = f"In-process run took {elapsed:.1f}s; timeout not enforced"
+        return result
+
+    # Runs after the timeout are unaffected, and match the default mode
+    if in_process != default:
+        mismatches = [(d, o) for d, o in zip(default, in_process) if d != o]
+        result.error = f"In-process differs from default mode: {mismatches[:2]}"
+        return result
+
+    result.passed = True
+    return result
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="benchmark.py execution mode smoke tests")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    args = parser.parse_args()
+
+    tests = [
+        test_modes_match_default,
+        test_persistent_worker_ignores_stray_stdout,
+        test_in_process_timeout,
+    ]
+
+    print("benchmark.py Execution Mode Tests")
+    print("=" * 40)
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        temp_dir = Path(tempfile.mkdtemp(prefix="mapper_bench_test_"))
+
+        try:
+            result = test_func(temp_dir)
+
+            if result.passed:
+                print(f"  PASS: {result.name}")
+                passed += 1
+            else:
+                print(f"  FAIL: {result.name}")
+                if args.verbose and result.error:
+                    print(f"        Error: {result.error}")
+                failed += 1
+
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print("=" * 40)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -203,9 +203,9 @@ Collections:
   llm       speaker-llm tests (23 tests)
   process   speaker-process tests (22 tests)
   report    speaker-report tests (26 tests)
-  segments  speaker_segments tests (8 tests)
+  segments  speaker_segments tests (11 tests)
   profiles  audio profiles tests (10 tests)
-  legacy    Original speaker_detection/samples tests (27 tests)
+  legacy    Original speaker_detection/samples tests (34 tests)
 
   docker    Build and run all tests in Docker container
   list      Show this help
@@ -222,9 +222,9 @@ Examples:
   ./run_speaker_diarization_tests.sh --doc catalog  # View catalog test docs
 
 Test counts:
-  Unit tests:  181 total
+  Unit tests:  191 total
   E2E tests:    17 total
-  Total:       198 tests
+  Total:       208 tests
 EOF
 }
 
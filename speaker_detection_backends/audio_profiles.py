@@ -5,11 +5,12 @@ Different backends may require different audio formats for optimal performance.
 This module provides a profiles system for specifying audio format requirements.
 """
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioProfile:
     """
     Audio format profile specifying requirements for a backend.
@@ -29,6 +30,15 @@ class AudioProfile:
     max_duration_sec: Optional[float] = None
 
 
+# ffmpeg PCM codec for each supported wav bit depth
+_WAV_CODEC_BY_DEPTH: Dict[int, str] = {
+    8: "pcm_u8",
+    16: "pcm_s16le",
+    24: "pcm_s24le",
+    32: "pcm_s32le",
+}
+
+
 # Default profiles for known backends
 PROFILES: Dict[str, AudioProfile] = {
     "speechmatics": AudioProfile(
@@ -75,6 +85,13 @@ def format_ffmpeg_args(profile: AudioProfile) -> List[str]:
         >>> format_ffmpeg_args(profile)
         ['-ar', '16000', '-ac', '1', '-f', 'wav']
     """
+    # Profiles are frozen, so the argument list can be built once per profile
+    return list(_ffmpeg_args_for(profile))
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_args_for(profile: AudioProfile) -> tuple:
+    """Build ffmpeg arguments for a profile (cached; callers get a copy)."""
     args = []
 
     # Sample rate
@@ -87,17 +104,11 @@ def format_ffmpeg_args(profile: AudioProfile) -> List[str]:
     args.extend(["-f", profile.format])
 
     # Bit depth - map to audio codec for wav format
-    if profile.format == "wav":
-        if profile.bit_depth == 16:
-            args.extend(["-acodec", "pcm_s16le"])
-        elif profile.bit_depth == 24:
-            args.extend(["-acodec", "pcm_s24le"])
-        elif profile.bit_depth == 32:
-            args.extend(["-acodec", "pcm_s32le"])
-        elif profile.bit_depth == 8:
-            args.extend(["-acodec", "pcm_u8"])
-
-    return args
+    codec = _WAV_CODEC_BY_DEPTH.get(profile.bit_depth)
+    if codec and profile.format == "wav":
+        args.extend(["-acodec", codec])
+
+    return tuple(args)
 
 
 def register_profile(name: str, profile: AudioProfile) -> None:
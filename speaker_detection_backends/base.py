@@ -8,6 +8,7 @@ provider-specific APIs or local models.
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any, Union
+import functools
 import importlib
 import os
 
@@ -22,6 +23,10 @@ from speaker_detection_backends.audio_profiles import AudioProfile, get_profile
 class EmbeddingBackend(ABC):
     """Abstract base class for speaker embedding backends."""
 
+    # Environment variables read by __init__. get_backend() builds a new
+    # instance when any of them changes instead of reusing the cached one.
+    config_env: Tuple[str, ...] = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -205,9 +210,6 @@ _DEFAULT_BACKENDS = {
     "speechmatics": "speaker_detection_backends.speechmatics_backend",
 }
 
-# Cached loaded backends
-_LOADED_BACKENDS: Optional[Dict[str, str]] = None
-
 
 def _load_backends_config() -> Dict[str, str]:
     """
@@ -217,18 +219,22 @@ def _load_backends_config() -> Dict[str, str]:
     1. $SPEAKER_BACKENDS_CONFIG (if set)
     2. speaker_detection_backends/backends.yaml (relative to this file)
 
+    The result is cached per $SPEAKER_BACKENDS_CONFIG value, so changing
+    the variable picks up the other file; call reload_backends_config()
+    after editing a config file in place.
+
     Returns:
         Dict mapping backend names to module paths
     """
-    global _LOADED_BACKENDS
+    return _load_backends_config_cached(os.environ.get("SPEAKER_BACKENDS_CONFIG"))
 
-    if _LOADED_BACKENDS is not None:
-        return _LOADED_BACKENDS
 
+@functools.lru_cache(maxsize=4)
+def _load_backends_config_cached(env_path: Optional[str]) -> Dict[str, str]:
+    """Resolve, read and parse the backends config for a $SPEAKER_BACKENDS_CONFIG value."""
     config_path = None
 
     # Check environment variable
-    env_path = os.environ.get("SPEAKER_BACKENDS_CONFIG")
     if env_path:
         config_path = Path(env_path)
         if not config_path.exists():
@@ -246,8 +252,10 @@ def _load_backends_config() -> Dict[str, str]:
     if config_path:
         try:
             import yaml
+            # C-accelerated loader when libyaml is available
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             with open(config_path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=loader)
 
             backends = {}
             for name, info in data.get("backends", {}).items():
@@ -256,7 +264,6 @@ def _load_backends_config() -> Dict[str, str]:
                 elif isinstance(info, str):
                     backends[name] = info
 
-            _LOADED_BACKENDS = backends
             return backends
         except ImportError:
             # PyYAML not available, use defaults
@@ -265,14 +272,24 @@ def _load_backends_config() -> Dict[str, str]:
             import sys
             print(f"Warning: Failed to load backends config: {e}", file=sys.stderr)
 
-    _LOADED_BACKENDS = _DEFAULT_BACKENDS.copy()
-    return _LOADED_BACKENDS
+    return _DEFAULT_BACKENDS.copy()
+
+
+# Constructed backends by name, each with the configuration it was built
+# from: (module path, values of its config_env variables). Local-model
+# backends load weights in __init__, so only one instance per name is kept.
+_BACKEND_INSTANCES: Dict[str, Tuple[Tuple[str, Tuple[Optional[str], ...]], EmbeddingBackend]] = {}
 
 
 def get_backend(name: str) -> EmbeddingBackend:
     """
     Get a backend instance by name.
 
+    Instances are reused while the backend's configuration is unchanged:
+    the module the config maps the name to, and the environment variables
+    listed in the backend's config_env. A change builds a new instance that
+    replaces the old one; see also clear_backend_cache().
+
     Args:
         name: Backend identifier
 
@@ -290,7 +307,21 @@ def get_backend(name: str) -> EmbeddingBackend:
 
     module_path = backends[name]
     module = importlib.import_module(module_path)
-    return module.Backend()
+    backend_cls = module.Backend
+    config = (module_path, tuple(os.environ.get(var) for var in backend_cls.config_env))
+
+    cached = _BACKEND_INSTANCES.get(name)
+    if cached is not None and cached[0] == config:
+        return cached[1]
+
+    instance = backend_cls()
+    _BACKEND_INSTANCES[name] = (config, instance)
+    return instance
+
+
+def clear_backend_cache() -> None:
+    """Drop cached backend instances (useful for testing)."""
+    _BACKEND_INSTANCES.clear()
 
 
 def list_backends() -> List[str]:
@@ -300,5 +331,5 @@ def list_backends() -> List[str]:
 
 def reload_backends_config() -> None:
     """Force reload of backends config (useful for testing)."""
-    global _LOADED_BACKENDS
-    _LOADED_BACKENDS = None
+    _load_backends_config_cached.cache_clear()
+    clear_backend_cache()
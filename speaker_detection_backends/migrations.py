@@ -19,10 +19,21 @@ Usage:
 
     # Migrate sample metadata on load
     metadata = migrate_sample_metadata(loaded_metadata)
+
+    # Bulk loaders can skip the call for files already at the current schema
+    if profile_needs_migration(loaded_profile):
+        profile = migrate_profile(loaded_profile)
+
+    # Bulk upgrades: collect per-record messages, write them once at the end
+    with batch_migration_messages():
+        profiles = [migrate_profile(p) for p in loaded_profiles]
 """
 
+import contextlib
+import contextvars
+import functools
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 import sys
 
 # Current schema versions
@@ -32,9 +43,75 @@ SAMPLE_METADATA_VERSION = 2
 # Type aliases
 ProfileType = Dict[str, Any]
 MetadataType = Dict[str, Any]
+# Migration functions update the dict they are given in place and return
+# it; migrate_profile/migrate_sample_metadata copy once before the first step
 MigrationFunc = Callable[[Dict[str, Any]], Dict[str, Any]]
 
 
+# Messages collected by the innermost open batch_migration_messages() block,
+# or None to print each message to stderr as it happens. A ContextVar keeps
+# batches in different threads or asyncio tasks apart.
+_migration_log: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "_migration_log", default=None
+)
+
+
+def _report(message: str) -> None:
+    """Print a migration message, or collect it if a batch is open."""
+    log = _migration_log.get()
+    if log is not None:
+        log.append(message)
+    else:
+        print(message, file=sys.stderr)
+
+
+@contextlib.contextmanager
+def batch_migration_messages(stream: Optional[TextIO] = None) -> Iterator[None]:
+    """
+    Collect migration messages and write them in a single write on exit.
+
+    Bulk loaders wrap their loop in this so migrating thousands of records
+    does not write to stderr once per record. Nested blocks hand their
+    messages to the enclosing block.
+
+    Args:
+        stream: Where to write the messages (default: sys.stderr)
+    """
+    outer = _migration_log.get()
+    messages: List[str] = []
+    token = _migration_log.set(messages)
+    try:
+        yield
+    finally:
+        _migration_log.reset(token)
+        if outer is not None:
+            outer.extend(messages)
+        elif messages:
+            (stream or sys.stderr).write("\n".join(messages) + "\n")
+
+
+def _build_chain(migrations: Dict[Tuple[int, int], MigrationFunc]) -> List[Optional[MigrationFunc]]:
+    """
+    Index a migration registry by source version.
+
+    chain[v] is the function migrating v -> v + 1, or None if there is no
+    such step. Registries only hold single-version steps.
+    """
+    chain: List[Optional[MigrationFunc]] = [None] * (max((fr for fr, _ in migrations), default=-1) + 1)
+    for (from_version, to_version), func in migrations.items():
+        assert to_version == from_version + 1, f"non-sequential migration {from_version} -> {to_version}"
+        chain[from_version] = func
+    return chain
+
+
+def _next_migration(chain: List[Optional[MigrationFunc]], version: int) -> Optional[MigrationFunc]:
+    """Return the migration from version to version + 1, or None if there is none."""
+    # Integral floats (e.g. "version: 1.0" in YAML) index like their int value
+    if 0 <= version < len(chain) and version == int(version):
+        return chain[int(version)]
+    return None
+
+
 # =============================================================================
 # Profile Migrations (db/*.json)
 # =============================================================================
@@ -47,7 +124,6 @@ def _migrate_profile_v0_to_v1(profile: ProfileType) -> ProfileType:
     - Add version field
     - Ensure required fields exist
     """
-    profile = profile.copy()
     profile["version"] = 1
 
     # Ensure required fields with defaults
@@ -70,6 +146,9 @@ PROFILE_MIGRATIONS: Dict[Tuple[int, int], MigrationFunc] = {
     # (1, 2): _migrate_profile_v1_to_v2,
 }
 
+# PROFILE_MIGRATIONS indexed by from_version
+_PROFILE_CHAIN = _build_chain(PROFILE_MIGRATIONS)
+
 
 def migrate_profile(
     profile: ProfileType,
@@ -100,25 +179,21 @@ def migrate_profile(
     migrated = profile
     while current_version < target_version:
         next_version = current_version + 1
-        migration_key = (current_version, next_version)
+        migration_func = _next_migration(_PROFILE_CHAIN, current_version)
 
-        if migration_key not in PROFILE_MIGRATIONS:
+        if migration_func is None:
             # No migration path available
-            print(
-                f"Warning: No migration from profile v{current_version} to v{next_version}",
-                file=sys.stderr,
-            )
+            _report(f"Warning: No migration from profile v{current_version} to v{next_version}")
             break
 
-        migration_func = PROFILE_MIGRATIONS[migration_key]
+        # Copy once for the whole chain; steps then update it in place
+        if migrated is profile:
+            migrated = profile.copy()
         migrated = migration_func(migrated)
         migrated["version"] = next_version
         current_version = next_version
 
-        print(
-            f"Migrated profile '{migrated.get('id', '?')}' to v{next_version}",
-            file=sys.stderr,
-        )
+        _report(f"Migrated profile '{migrated.get('id', '?')}' to v{next_version}")
 
     return migrated
 
@@ -136,7 +211,6 @@ def _migrate_metadata_v1_to_v2(meta: MetadataType) -> MetadataType:
     - Add b3sum field (set to empty, requires recomputation)
     - Add source.audio_b3sum field (set to empty, requires recomputation)
     """
-    meta = meta.copy()
     meta["version"] = 2
 
     # Add review section if missing
@@ -166,7 +240,6 @@ def _migrate_metadata_v0_to_v1(meta: MetadataType) -> MetadataType:
     - Add version field
     - Ensure basic structure exists
     """
-    meta = meta.copy()
     meta["version"] = 1
 
     # Ensure basic structure
@@ -190,6 +263,9 @@ METADATA_MIGRATIONS: Dict[Tuple[int, int], MigrationFunc] = {
     # (2, 3): _migrate_metadata_v2_to_v3,
 }
 
+# METADATA_MIGRATIONS indexed by from_version
+_METADATA_CHAIN = _build_chain(METADATA_MIGRATIONS)
+
 
 def migrate_sample_metadata(
     meta: MetadataType,
@@ -218,16 +294,14 @@ def migrate_sample_metadata(
     migrated = meta
     while current_version < target_version:
         next_version = current_version + 1
-        migration_key = (current_version, next_version)
+        migration_func = _next_migration(_METADATA_CHAIN, current_version)
 
-        if migration_key not in METADATA_MIGRATIONS:
-            print(
-                f"Warning: No migration from metadata v{current_version} to v{next_version}",
-                file=sys.stderr,
-            )
+        if migration_func is None:
+            _report(f"Warning: No migration from metadata v{current_version} to v{next_version}")
             break
 
-        migration_func = METADATA_MIGRATIONS[migration_key]
+        if migrated is meta:
+            migrated = meta.copy()
         migrated = migration_func(migrated)
         migrated["version"] = next_version
         current_version = next_version
@@ -240,6 +314,16 @@ def needs_migration(data: Dict[str, Any], target_version: int) -> bool:
     return data.get("version", 0) < target_version
 
 
+def profile_needs_migration(profile: ProfileType) -> bool:
+    """Check if a profile is below PROFILE_SCHEMA_VERSION (cheap pre-check for loaders)."""
+    return profile.get("version", 0) < PROFILE_SCHEMA_VERSION
+
+
+def sample_metadata_needs_migration(meta: MetadataType) -> bool:
+    """Check if sample metadata is below SAMPLE_METADATA_VERSION (cheap pre-check for loaders)."""
+    return meta.get("version", 0) < SAMPLE_METADATA_VERSION
+
+
 # =============================================================================
 # Batch Migration Utilities
 # =============================================================================
@@ -270,8 +354,14 @@ def get_migration_plan(
     return plan
 
 
+@functools.lru_cache(maxsize=1)
 def describe_migrations() -> str:
-    """Return a human-readable description of available migrations."""
+    """
+    Return a human-readable description of available migrations.
+
+    The registries are fixed at import time, so the text is built once;
+    call describe_migrations.cache_clear() after changing them (tests).
+    """
     lines = [
         "Available Schema Migrations",
         "=" * 40,
@@ -19,10 +19,22 @@ Usage:
         validate_profile(profile_dict)
     except ValidationError as e:
         print(f"Invalid profile: {e}")
+
+    # Loaders: upgrade and check in one call
+    profile, warnings = migrate_and_validate_profile(loaded_profile)
 """
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
+
+from speaker_detection_backends.migrations import (
+    PROFILE_SCHEMA_VERSION,
+    SAMPLE_METADATA_VERSION,
+    migrate_profile,
+)
 
 
 class ValidationError(Exception):
@@ -35,11 +47,68 @@ PROFILE_REQUIRED_FIELDS = {"id", "names"}
 EMBEDDING_REQUIRED_FIELDS = {"id", "external_id", "created_at"}
 SAMPLE_METADATA_REQUIRED_FIELDS = {"sample_id", "source", "segment"}
 
-# Valid trust levels
-VALID_TRUST_LEVELS = {"high", "medium", "low", "invalidated"}
+# Sorted tuples of the above: checking a few required keys against the
+# record is cheaper than building a set of all its keys
+_PROFILE_REQUIRED = tuple(sorted(PROFILE_REQUIRED_FIELDS))
+_EMBEDDING_REQUIRED = tuple(sorted(EMBEDDING_REQUIRED_FIELDS))
+_SAMPLE_METADATA_REQUIRED = tuple(sorted(SAMPLE_METADATA_REQUIRED_FIELDS))
+
+# Valid trust levels (frozen: the error messages below are built from them)
+VALID_TRUST_LEVELS = frozenset({"high", "medium", "low", "invalidated"})
 
 # Valid review statuses
-VALID_REVIEW_STATUSES = {"pending", "reviewed", "rejected"}
+VALID_REVIEW_STATUSES = frozenset({"pending", "reviewed", "rejected"})
+
+# "expected one of" lists for error messages, joined once
+_VALID_TRUST_MSG = ", ".join(sorted(VALID_TRUST_LEVELS))
+_VALID_REVIEW_MSG = ", ".join(sorted(VALID_REVIEW_STATUSES))
+
+# Sample hash lists in an embedding's 'samples' section, in report order
+_SAMPLE_LIST_KEYS = ("reviewed", "unreviewed", "rejected")
+
+# Keys of the columnar source_segments form
+_SEGMENT_COLUMNS = {"start", "end"}
+
+
+@lru_cache(maxsize=4096)
+def _is_iso_timestamp(value: str) -> bool:
+    """
+    Return True if value parses as an ISO 8601 timestamp ('Z' suffix allowed).
+
+    Cached because embeddings created in one batch share created_at strings.
+    fromisoformat() defines what "valid" means here; a format regex would
+    accept different strings (e.g. month 13).
+    """
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+def _all_str(items: List[Any]) -> bool:
+    """Return True if every item is a string (map() avoids a generator frame)."""
+    return all(map(isinstance, items, repeat(str)))
+
+
+def _all_number(items: List[Any]) -> bool:
+    """Return True if every item is an int or float."""
+    return all(map(isinstance, items, repeat((int, float))))
+
+
+# Fewest items for which validate_all(workers > 1) starts a process pool.
+# Pickling an item to a worker and back costs about 80% of validating it,
+# and starting the pool tens of milliseconds, so smaller runs are faster
+# serially.
+_PARALLEL_MIN_ITEMS = 5000
+
+
+def _looks_current(item: Dict[str, Any], version: int, required: Tuple[str, ...]) -> bool:
+    """Cheap audit pre-check: item is at the current schema version and has its required keys."""
+    return item.get("version") == version and all(map(item.__contains__, required))
+
+
+# Validators read optional fields with `in` + subscript, which is cheaper than d.get() on CPython
 
 
 def validate_profile(profile: Dict[str, Any], strict: bool = False) -> List[str]:
@@ -66,16 +135,17 @@ def validate_profile(profile: Dict[str, Any], strict: bool = False) -> List[str]
         return [msg]
 
     # Check required fields
-    missing = PROFILE_REQUIRED_FIELDS - set(profile.keys())
+    missing = [f for f in _PROFILE_REQUIRED if f not in profile]
     if missing:
-        msg = f"Missing required fields: {', '.join(sorted(missing))}"
+        msg = f"Missing required fields: {', '.join(missing)}"
         if strict:
             raise ValidationError(msg)
         warnings.append(msg)
 
     # Validate id
     if "id" in profile:
-        if not isinstance(profile["id"], str) or not profile["id"]:
+        pid = profile["id"]
+        if not isinstance(pid, str) or not pid:
             msg = "Profile 'id' must be a non-empty string"
             if strict:
                 raise ValidationError(msg)
@@ -101,7 +171,7 @@ def validate_profile(profile: Dict[str, Any], strict: bool = False) -> List[str]
             if strict:
                 raise ValidationError(msg)
             warnings.append(msg)
-        elif not all(isinstance(t, str) for t in tags):
+        elif not _all_str(tags):
             msg = "All tags must be strings"
             if strict:
                 raise ValidationError(msg)
@@ -125,13 +195,15 @@ def validate_profile(profile: Dict[str, Any], strict: bool = False) -> List[str]
                 else:
                     for i, emb in enumerate(emb_list):
                         emb_warnings = validate_embedding(emb, strict=False)
-                        for w in emb_warnings:
-                            warnings.append(f"embeddings.{backend}[{i}]: {w}")
+                        if emb_warnings:
+                            prefix = f"embeddings.{backend}[{i}]: "
+                            warnings.extend([prefix + w for w in emb_warnings])
 
     # Validate version
     if "version" in profile:
-        if not isinstance(profile["version"], int):
-            msg = f"Profile 'version' must be an int, got {type(profile['version']).__name__}"
+        version = profile["version"]
+        if not isinstance(version, int):
+            msg = f"Profile 'version' must be an int, got {type(version).__name__}"
             warnings.append(msg)
 
     return warnings
@@ -161,16 +233,17 @@ def validate_embedding(embedding: Dict[str, Any], strict: bool = False) -> List[
         return [msg]
 
     # Check required fields
-    missing = EMBEDDING_REQUIRED_FIELDS - set(embedding.keys())
+    missing = [f for f in _EMBEDDING_REQUIRED if f not in embedding]
     if missing:
-        msg = f"Missing required fields: {', '.join(sorted(missing))}"
+        msg = f"Missing required fields: {', '.join(missing)}"
         if strict:
             raise ValidationError(msg)
         warnings.append(msg)
 
     # Validate id
     if "id" in embedding:
-        if not isinstance(embedding["id"], str) or not embedding["id"]:
+        eid = embedding["id"]
+        if not isinstance(eid, str) or not eid:
             msg = "Embedding 'id' must be a non-empty string"
             if strict:
                 raise ValidationError(msg)
@@ -198,7 +271,7 @@ def validate_embedding(embedding: Dict[str, Any], strict: bool = False) -> List[
     if "trust_level" in embedding:
         tl = embedding["trust_level"]
         if tl not in VALID_TRUST_LEVELS:
-            msg = f"Invalid trust_level '{tl}', expected one of: {', '.join(sorted(VALID_TRUST_LEVELS))}"
+            msg = f"Invalid trust_level '{tl}', expected one of: {_VALID_TRUST_MSG}"
             if strict:
                 raise ValidationError(msg)
             warnings.append(msg)
@@ -207,9 +280,7 @@ def validate_embedding(embedding: Dict[str, Any], strict: bool = False) -> List[
     if "created_at" in embedding:
         ca = embedding["created_at"]
         if isinstance(ca, str):
-            try:
-                datetime.fromisoformat(ca.replace("Z", "+00:00"))
-            except ValueError:
+            if not _is_iso_timestamp(ca):
                 msg = f"Embedding 'created_at' is not valid ISO format: {ca}"
                 warnings.append(msg)
         else:
@@ -220,23 +291,35 @@ def validate_embedding(embedding: Dict[str, Any], strict: bool = False) -> List[
     if "samples" in embedding:
         samples = embedding["samples"]
         if isinstance(samples, dict):
-            expected_keys = {"reviewed", "unreviewed", "rejected"}
-            for key in expected_keys:
+            for key in _SAMPLE_LIST_KEYS:
                 if key in samples:
-                    if not isinstance(samples[key], list):
+                    hashes = samples[key]
+                    if not isinstance(hashes, list):
                         msg = f"samples.{key} must be a list"
                         warnings.append(msg)
-                    elif not all(isinstance(s, str) for s in samples[key]):
+                    elif not _all_str(hashes):
                         msg = f"samples.{key} must contain only strings (b3sum hashes)"
                         warnings.append(msg)
         elif samples is not None:
             msg = f"Embedding 'samples' must be a dict or null, got {type(samples).__name__}"
             warnings.append(msg)
 
-    # Validate source_segments
+    # Validate source_segments: a list of {"start", "end"} dicts (the columnar
+    # {"start": [...], "end": [...]} form is accepted for compatibility only)
     if "source_segments" in embedding:
         segs = embedding["source_segments"]
-        if segs is not None and not isinstance(segs, list):
+        if isinstance(segs, dict) and segs.keys() == _SEGMENT_COLUMNS:
+            starts, ends = segs["start"], segs["end"]
+            if not isinstance(starts, list) or not isinstance(ends, list):
+                msg = "source_segments 'start' and 'end' must be lists"
+                warnings.append(msg)
+            elif len(starts) != len(ends):
+                msg = f"source_segments has {len(starts)} starts but {len(ends)} ends"
+                warnings.append(msg)
+            elif not (_all_number(starts) and _all_number(ends)):
+                msg = "source_segments 'start' and 'end' must contain only numbers"
+                warnings.append(msg)
+        elif segs is not None and not isinstance(segs, list):
             msg = f"Embedding 'source_segments' must be a list or null"
             warnings.append(msg)
         elif isinstance(segs, list):
@@ -275,9 +358,9 @@ def validate_sample_metadata(metadata: Dict[str, Any], strict: bool = False) ->
         return [msg]
 
     # Check required fields
-    missing = SAMPLE_METADATA_REQUIRED_FIELDS - set(metadata.keys())
+    missing = [f for f in _SAMPLE_METADATA_REQUIRED if f not in metadata]
     if missing:
-        msg = f"Missing required fields: {', '.join(sorted(missing))}"
+        msg = f"Missing required fields: {', '.join(missing)}"
         if strict:
             raise ValidationError(msg)
         warnings.append(msg)
@@ -321,7 +404,7 @@ def validate_sample_metadata(metadata: Dict[str, Any], strict: bool = False) ->
         elif "status" in review:
             status = review["status"]
             if status not in VALID_REVIEW_STATUSES:
-                msg = f"Invalid review status '{status}', expected: {', '.join(sorted(VALID_REVIEW_STATUSES))}"
+                msg = f"Invalid review status '{status}', expected: {_VALID_REVIEW_MSG}"
                 if strict:
                     raise ValidationError(msg)
                 warnings.append(msg)
@@ -345,10 +428,45 @@ def validate_sample_metadata(metadata: Dict[str, Any], strict: bool = False) ->
     return warnings
 
 
+def migrate_and_validate_profile(
+    profile: Dict[str, Any],
+    strict: bool = False,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Migrate a loaded profile to the current schema and validate it.
+
+    For loaders that would otherwise call migrate_profile() and then
+    validate_profile(). Profiles already at PROFILE_SCHEMA_VERSION go
+    straight to validation without entering the migration chain. So do
+    profiles whose version is not a number; validate_profile() reports it.
+
+    Args:
+        profile: Profile dict as loaded from disk
+        strict: If True, raise ValidationError on issues
+
+    Returns:
+        (profile, warnings): the migrated profile (the original object if no
+        migration ran) and its validation warnings
+
+    Raises:
+        ValidationError: If strict=True and validation fails
+    """
+    version = profile.get("version", 0) if isinstance(profile, dict) else None
+    if (
+        isinstance(version, (int, float))
+        and not isinstance(version, bool)
+        and version < PROFILE_SCHEMA_VERSION
+    ):
+        profile = migrate_profile(profile)
+    return profile, validate_profile(profile, strict=strict)
+
+
 def validate_all(
     profiles: Optional[List[Dict[str, Any]]] = None,
     embeddings: Optional[List[Dict[str, Any]]] = None,
     sample_metadata: Optional[List[Dict[str, Any]]] = None,
+    quick: bool = False,
+    workers: int = 1,
 ) -> Dict[str, List[str]]:
     """
     Validate multiple items and return all warnings.
@@ -357,31 +475,71 @@ def validate_all(
         profiles: List of profiles to validate
         embeddings: List of embeddings to validate
         sample_metadata: List of sample metadata to validate
+        quick: Audit mode. Skip full validation of profiles and sample
+            metadata that are at the current schema version and have all
+            required fields. Embeddings carry no version and are always
+            fully validated. Use the default (full) mode when strictness
+            matters.
+        workers: Number of worker processes. Above 1, runs with at least
+            _PARALLEL_MIN_ITEMS items to validate use a process pool;
+            smaller runs stay serial, as starting workers and pickling
+            every item to them and its warnings back costs more than the
+            validation itself.
 
     Returns:
         Dict mapping item identifiers to their warnings
     """
     all_warnings = {}
 
-    if profiles:
-        for i, profile in enumerate(profiles):
-            pid = profile.get("id", f"profile[{i}]")
-            warnings = validate_profile(profile)
-            if warnings:
-                all_warnings[f"profile:{pid}"] = warnings
-
-    if embeddings:
-        for i, emb in enumerate(embeddings):
-            eid = emb.get("id", f"embedding[{i}]")
-            warnings = validate_embedding(emb)
-            if warnings:
-                all_warnings[f"embedding:{eid}"] = warnings
-
-    if sample_metadata:
-        for i, meta in enumerate(sample_metadata):
-            sid = meta.get("sample_id", f"sample[{i}]")
-            warnings = validate_sample_metadata(meta)
-            if warnings:
-                all_warnings[f"sample:{sid}"] = warnings
+    # (key prefix, id field, items, validator, schema version, required fields)
+    sections = (
+        ("profile", "id", profiles, validate_profile,
+         PROFILE_SCHEMA_VERSION, _PROFILE_REQUIRED),
+        ("embedding", "id", embeddings, validate_embedding, None, None),
+        ("sample", "sample_id", sample_metadata, validate_sample_metadata,
+         SAMPLE_METADATA_VERSION, _SAMPLE_METADATA_REQUIRED),
+    )
+
+    # Select what to validate first, so the pool is only started when
+    # there is enough work to pay for it
+    work = []
+    for kind, id_field, items, validate, version, required in sections:
+        if not items:
+            continue
+
+        if quick and version is not None:
+            indices = [
+                i for i, item in enumerate(items)
+                if not _looks_current(item, version, required)
+            ]
+            items = [items[i] for i in indices]
+        else:
+            indices = range(len(items))
+
+        if items:
+            work.append((kind, id_field, indices, items, validate))
+
+    total = sum(len(items) for _, _, _, items, _ in work)
+    executor = None
+    if workers > 1 and total >= _PARALLEL_MIN_ITEMS:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        for kind, id_field, indices, items, validate in work:
+            if executor is None:
+                results = map(validate, items)
+            else:
+                chunksize = max(1, len(items) // (workers * 4))
+                results = executor.map(validate, items, chunksize=chunksize)
+
+            # Item keys are only built for items that have warnings; on a
+            # clean repository that skips a dict lookup and an f-string per item.
+            for i, item, warnings in zip(indices, items, results):
+                if warnings:
+                    item_id = item.get(id_field, f"{kind}[{i}]")
+                    all_warnings[f"{kind}:{item_id}"] = warnings
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return all_warnings
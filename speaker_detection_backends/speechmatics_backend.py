@@ -54,6 +54,8 @@ class SpeechmaticsBackend(EmbeddingBackend):
     used with the Speechmatics API.
     """
 
+    config_env = ("SPEECHMATICS_API_KEY",)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
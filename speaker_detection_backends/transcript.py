@@ -8,6 +8,7 @@ Supports multiple transcript formats:
 
 Usage:
     from speaker_detection_backends.transcript import (
+        TranscriptIndex,
         detect_transcript_format,
         get_available_speakers,
         extract_segments_from_transcript,
@@ -16,10 +17,117 @@ Usage:
     fmt = detect_transcript_format(data)
     speakers = get_available_speakers(data)
     segments = extract_segments_from_transcript(data, "S1")
+
+    # Several queries on one transcript: scan it once
+    index = TranscriptIndex(data)
+    for speaker in index.speakers():
+        segments = index.segments(speaker)
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True)
+class RawSegments:
+    """
+    One speaker's unmerged segments as parallel lists (internal).
+
+    Columns instead of one {"start", "end", "text"} dict per segment: the
+    extractors fill them with list comprehensions and the merger walks them
+    with zip(), without a dict allocation or key lookup per segment.
+    """
+
+    starts: List[Any]
+    ends: List[Any]
+    texts: List[str]
+
+
+class TranscriptIndex:
+    """
+    Values derived from one parsed transcript, computed on first use.
+
+    For callers that query a transcript several times (list its speakers,
+    then extract one or more of them): the format, the speaker list and
+    the Speechmatics speaker runs are scanned once per index instead of
+    once per call. The caller owns the index; it does not watch data for
+    changes, so build a new one after editing the transcript. The
+    module-level functions build a fresh index on every call.
+
+    Usage:
+        index = TranscriptIndex(data)
+        for speaker in index.speakers():
+            segments = index.segments_as_tuples(speaker)
+    """
+
+    __slots__ = ("data", "_cache")
+
+    def __init__(self, data: Dict[str, Any], fmt: Optional[str] = None):
+        """
+        Args:
+            data: Parsed transcript JSON
+            fmt: Format from detect_transcript_format(), if the caller
+                already has it; detected on first use when None
+        """
+        self.data = data
+        self._cache: Dict[str, Any] = {}
+        if fmt is not None:
+            self._cache["format"] = fmt
+
+    @property
+    def format(self) -> str:
+        """'assemblyai', 'speechmatics', or 'unknown'."""
+        fmt = self._cache.get("format")
+        if fmt is None:
+            fmt = self._cache["format"] = detect_transcript_format(self.data)
+        return fmt
+
+    def speakers(self) -> List[str]:
+        """Sorted list of speaker labels found in the transcript."""
+        speakers = self._cache.get("speakers")
+        if speakers is None:
+            speakers = self._cache["speakers"] = tuple(_collect_speakers(self))
+        return list(speakers)
+
+    def segments(
+        self,
+        speaker_label: str,
+        min_duration: float = 0.5,
+        max_gap: float = 1.0,
+    ) -> List[Dict[str, Any]]:
+        """See extract_segments_from_transcript()."""
+        fmt = self.format
+
+        # Raw segments stay columnar; dicts are only built for merged output
+        if fmt == "assemblyai":
+            raw_segments = _raw_assemblyai(self.data, speaker_label)
+        elif fmt == "speechmatics":
+            raw_segments = _raw_speechmatics(self, speaker_label)
+        else:
+            raw_segments = RawSegments([], [], [])
+
+        # Merge close segments and filter by duration
+        return _merge_and_filter_segments(raw_segments, min_duration, max_gap)
+
+    def segments_as_tuples(self, speaker_label: str) -> List[Tuple[float, float]]:
+        """See extract_segments_as_tuples(); repeated labels reuse the result."""
+        cache = self._cache.get("segment_tuples")
+        if cache is None:
+            cache = self._cache["segment_tuples"] = {}
+        try:
+            segments = cache.get(speaker_label)
+        except TypeError:
+            # Unhashable label (malformed transcript): compute without caching
+            return _segment_tuples(self, speaker_label)
+        if segments is None:
+            segments = cache[speaker_label] = tuple(_segment_tuples(self, speaker_label))
+        return list(segments)
 
 
 def detect_transcript_format(data: Dict[str, Any]) -> str:
@@ -37,45 +145,52 @@ def detect_transcript_format(data: Dict[str, Any]) -> str:
         return "assemblyai"
 
     # Speechmatics has "results" array
-    if "results" in data and isinstance(data.get("results"), list):
-        results = data["results"]
-        if results:
-            first = results[0]
-            # Check for Speechmatics-style fields
-            if "alternatives" in first:
-                return "speechmatics"
-            if "start_time" in first:
-                return "speechmatics"
-            # Also check type field
-            if first.get("type") in ("word", "punctuation"):
-                return "speechmatics"
+    results = data.get("results")
+    if isinstance(results, list) and results:
+        first = results[0]
+        # Check for Speechmatics-style fields
+        if "alternatives" in first:
+            return "speechmatics"
+        if "start_time" in first:
+            return "speechmatics"
+        # Also check type field
+        if first.get("type") in ("word", "punctuation"):
+            return "speechmatics"
 
     return "unknown"
 
 
-def get_available_speakers(data: Dict[str, Any]) -> List[str]:
+def get_available_speakers(
+    data: Dict[str, Any],
+    *,
+    fmt: Optional[str] = None,
+) -> List[str]:
     """
     Get list of unique speaker labels in transcript.
 
     Args:
         data: Parsed transcript JSON
+        fmt: Format from detect_transcript_format(), if the caller already
+            has it; detected when None
 
     Returns:
         Sorted list of speaker labels found in transcript
     """
-    fmt = detect_transcript_format(data)
+    return _collect_speakers(TranscriptIndex(data, fmt))
+
+
+def _collect_speakers(index: TranscriptIndex) -> List[str]:
+    """Scan the transcript behind index for speaker labels."""
+    fmt = index.format
     speakers = set()
 
     if fmt == "assemblyai":
-        for utt in data.get("utterances", []):
+        for utt in index.data.get("utterances", []):
             if "speaker" in utt:
                 speakers.add(utt["speaker"])
 
     elif fmt == "speechmatics":
-        for item in data.get("results", []):
-            if item.get("type") != "word":
-                continue
-
+        for item in _speechmatics_words(index):
             # Check top level speaker field
             if "speaker" in item:
                 speakers.add(item["speaker"])
@@ -93,6 +208,8 @@ def extract_segments_from_transcript(
     speaker_label: str,
     min_duration: float = 0.5,
     max_gap: float = 1.0,
+    *,
+    fmt: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Extract time segments for a speaker from transcript.
@@ -104,25 +221,20 @@ def extract_segments_from_transcript(
         speaker_label: Speaker label to extract (e.g., 'S1', 'Alice')
         min_duration: Minimum segment duration in seconds
         max_gap: Maximum gap between segments to merge
+        fmt: Format from detect_transcript_format(), if the caller already
+            has it; detected when None
 
     Returns:
         List of segment dicts with keys: start, end, text
     """
-    fmt = detect_transcript_format(data)
-    raw_segments = []
-
-    if fmt == "assemblyai":
-        raw_segments = _extract_assemblyai(data, speaker_label)
-    elif fmt == "speechmatics":
-        raw_segments = _extract_speechmatics(data, speaker_label)
-
-    # Merge close segments and filter by duration
-    return _merge_and_filter_segments(raw_segments, min_duration, max_gap)
+    return TranscriptIndex(data, fmt).segments(speaker_label, min_duration, max_gap)
 
 
 def extract_segments_as_tuples(
     data: Dict[str, Any],
     speaker_label: str,
+    *,
+    fmt: Optional[str] = None,
 ) -> List[Tuple[float, float]]:
     """
     Extract time segments as (start, end) tuples.
@@ -132,164 +244,239 @@ def extract_segments_as_tuples(
     Args:
         data: Transcript JSON data
         speaker_label: Speaker label to extract
+        fmt: Format from detect_transcript_format(), if the caller already
+            has it; detected when None
 
     Returns:
         List of (start_sec, end_sec) tuples
     """
-    fmt = detect_transcript_format(data)
+    return _segment_tuples(TranscriptIndex(data, fmt), speaker_label)
+
+
+def _segment_tuples(index: TranscriptIndex, speaker_label: str) -> List[Tuple[float, float]]:
+    """Collect speaker_label's unmerged (start, end) tuples."""
+    fmt = index.format
     segments = []
 
     if fmt == "assemblyai":
-        for utt in data.get("utterances", []):
+        for utt in index.data.get("utterances", []):
             if utt.get("speaker") == speaker_label:
                 start = utt.get("start", 0) / 1000.0  # ms to sec
                 end = utt.get("end", 0) / 1000.0
                 segments.append((start, end))
 
     elif fmt == "speechmatics":
-        current_start = None
-        current_end = None
-        current_speaker = None
+        _, starts, ends, _ = _speechmatics_runs(index)
+        segments = [(starts[i], ends[i]) for i in _speaker_run_indices(index, speaker_label)]
 
-        for item in data.get("results", []):
-            if item.get("type") != "word":
-                continue
+    return segments
 
-            # Get speaker from item or alternatives
-            speaker = item.get("speaker")
-            if not speaker:
-                alts = item.get("alternatives", [])
-                if alts:
-                    speaker = alts[0].get("speaker")
-            speaker = speaker or "UU"
-
-            start = item.get("start_time", 0)
-            end = item.get("end_time", 0)
-
-            if speaker == speaker_label:
-                if current_speaker != speaker_label:
-                    # Save previous segment if any
-                    if current_start is not None and current_speaker == speaker_label:
-                        segments.append((current_start, current_end))
-                    current_start = start
-                current_end = end
-                current_speaker = speaker_label
-            else:
-                # Speaker changed
-                if current_speaker == speaker_label and current_start is not None:
-                    segments.append((current_start, current_end))
-                    current_start = None
-                current_speaker = speaker
-
-        # Don't forget last segment
-        if current_speaker == speaker_label and current_start is not None:
-            segments.append((current_start, current_end))
 
-    return segments
+def _raw_assemblyai(data: Dict[str, Any], speaker_label: str) -> RawSegments:
+    """Collect a speaker's AssemblyAI utterances as RawSegments."""
+    utts = [utt for utt in data.get("utterances", []) if utt.get("speaker") == speaker_label]
+    return RawSegments(
+        starts=[utt.get("start", 0) / 1000.0 for utt in utts],  # ms to sec
+        ends=[utt.get("end", 0) / 1000.0 for utt in utts],
+        texts=[utt.get("text", "") for utt in utts],
+    )
 
 
 def _extract_assemblyai(data: Dict[str, Any], speaker_label: str) -> List[Dict[str, Any]]:
     """Extract segments from AssemblyAI format transcript."""
-    segments = []
-    for utt in data.get("utterances", []):
-        if utt.get("speaker") == speaker_label:
-            start = utt.get("start", 0) / 1000.0  # ms to sec
-            end = utt.get("end", 0) / 1000.0
-            text = utt.get("text", "")
-            segments.append({"start": start, "end": end, "text": text})
-    return segments
+    return _segment_dicts(_raw_assemblyai(data, speaker_label))
 
 
-def _extract_speechmatics(data: Dict[str, Any], speaker_label: str) -> List[Dict[str, Any]]:
-    """Extract segments from Speechmatics format transcript."""
-    segments = []
-    current_start = None
-    current_end = None
-    current_text = []
-    current_speaker = None
+def _speechmatics_words(index: TranscriptIndex) -> List[Dict[str, Any]]:
+    """
+    Return the word items of a Speechmatics transcript, in order.
 
-    for item in data.get("results", []):
-        if item.get("type") != "word":
-            continue
+    Punctuation can be a large share of results; filtering it out once per
+    index lets each scan (speakers, runs) walk only the words.
+    """
+    cache = index._cache
+    words = cache.get("speechmatics_words")
+    if words is None:
+        words = cache["speechmatics_words"] = [
+            item for item in index.data.get("results", []) if item.get("type") == "word"
+        ]
+    return words
+
+
+def _speechmatics_runs(
+    index: TranscriptIndex,
+) -> Tuple[List[Any], List[Any], List[Any], List[List[str]]]:
+    """
+    Split a Speechmatics transcript into runs of consecutive same-speaker words.
+
+    Scans results once, for all speakers, and caches the result on the
+    index, so extracting several speakers through one index costs one scan.
+    Punctuation is skipped and does not break a run.
+
+    Returns:
+        Parallel lists (speakers, starts, ends, contents): the run's speaker
+        label ('UU' if unknown), first word start_time, last word end_time,
+        and the non-empty word contents
+    """
+    cache = index._cache
+    runs = cache.get("speechmatics_runs")
+    if runs is not None:
+        return runs
+
+    speakers: List[Any] = []
+    starts: List[Any] = []
+    ends: List[Any] = []
+    contents: List[List[str]] = []
+    current_speaker = None
+    words: List[str] = []
 
+    for item in _speechmatics_words(index):
         # Get speaker - check alternatives first (speaker identification mode)
         speaker = item.get("speaker")
         content = ""
-        alternatives = item.get("alternatives", [])
+        alternatives = item.get("alternatives")
         if alternatives:
+            best = alternatives[0]
             if not speaker:
-                speaker = alternatives[0].get("speaker")
-            content = alternatives[0].get("content", "")
+                speaker = best.get("speaker")
+            content = best.get("content", "")
 
         speaker = speaker or "UU"
-        start = item.get("start_time", 0)
         end = item.get("end_time", 0)
-
-        if speaker == speaker_label:
-            if current_speaker != speaker_label:
-                # New segment starts - save previous if any
-                if current_start is not None:
-                    segments.append({
-                        "start": current_start,
-                        "end": current_end,
-                        "text": " ".join(current_text),
-                    })
-                current_start = start
-                current_text = []
-            current_end = end
-            current_speaker = speaker_label
-            if content:
-                current_text.append(content)
-        else:
-            # Speaker changed
-            if current_speaker == speaker_label and current_start is not None:
-                segments.append({
-                    "start": current_start,
-                    "end": current_end,
-                    "text": " ".join(current_text),
-                })
-                current_start = None
-                current_text = []
+        if speaker != current_speaker:
+            # Speaker changed: start a new run
             current_speaker = speaker
+            words = []
+            speakers.append(speaker)
+            starts.append(item.get("start_time", 0))
+            ends.append(end)
+            contents.append(words)
+        else:
+            ends[-1] = end
+        if content:
+            words.append(content)
 
-    # Don't forget last segment
-    if current_speaker == speaker_label and current_start is not None:
-        segments.append({
-            "start": current_start,
-            "end": current_end,
-            "text": " ".join(current_text),
-        })
+    runs = cache["speechmatics_runs"] = (speakers, starts, ends, contents)
+    return runs
 
-    return segments
+
+def _speaker_run_indices(index: TranscriptIndex, speaker_label: str) -> List[int]:
+    """
+    Return the indices of speaker_label's runs in _speechmatics_runs(index).
+
+    Runs are grouped by speaker once per index, so extracting S speakers
+    costs one pass over the runs instead of S.
+    """
+    cache = index._cache
+    by_speaker = cache.get("speechmatics_index")
+    if by_speaker is None:
+        by_speaker = {}
+        try:
+            for i, speaker in enumerate(_speechmatics_runs(index)[0]):
+                by_speaker.setdefault(speaker, []).append(i)
+        except TypeError:
+            # Unhashable label in a malformed transcript: scan instead
+            by_speaker = False
+        cache["speechmatics_index"] = by_speaker
+
+    if by_speaker is not False:
+        try:
+            return by_speaker.get(speaker_label, [])
+        except TypeError:
+            pass
+    speakers = _speechmatics_runs(index)[0]
+    return [i for i, speaker in enumerate(speakers) if speaker == speaker_label]
+
+
+def _raw_speechmatics(index: TranscriptIndex, speaker_label: str) -> RawSegments:
+    """Collect a speaker's Speechmatics runs as RawSegments."""
+    _, starts, ends, contents = _speechmatics_runs(index)
+    indices = _speaker_run_indices(index, speaker_label)
+    return RawSegments(
+        starts=[starts[i] for i in indices],
+        ends=[ends[i] for i in indices],
+        texts=[" ".join(contents[i]) for i in indices],
+    )
+
+
+def _extract_speechmatics(data: Dict[str, Any], speaker_label: str) -> List[Dict[str, Any]]:
+    """Extract segments from Speechmatics format transcript."""
+    return _segment_dicts(_raw_speechmatics(TranscriptIndex(data), speaker_label))
+
+
+def _segment_dicts(raw: RawSegments) -> List[Dict[str, Any]]:
+    """Convert RawSegments to the public list of {"start", "end", "text"} dicts."""
+    return [
+        {"start": start, "end": end, "text": text}
+        for start, end, text in zip(raw.starts, raw.ends, raw.texts)
+    ]
 
 
 def _merge_and_filter_segments(
-    segments: List[Dict[str, Any]],
+    segments: RawSegments,
     min_duration: float,
     max_gap: float,
 ) -> List[Dict[str, Any]]:
-    """Merge close segments and filter by minimum duration."""
+    """
+    Merge close segments and filter by minimum duration.
+
+    Segments shorter than min_duration are dropped before merging. Texts
+    of merged segments are collected and joined once when the merged
+    segment is complete, instead of being re-concatenated at every merge,
+    and output dicts are only built then.
+    """
     merged = []
-    for seg in segments:
-        duration = seg["end"] - seg["start"]
-        if duration < min_duration:
+    cur_start = cur_end = None
+    cur_parts: Optional[List[str]] = None
+
+    for start, end, text in zip(segments.starts, segments.ends, segments.texts):
+        if end - start < min_duration:
             continue
 
-        if merged and (seg["start"] - merged[-1]["end"]) <= max_gap:
+        if cur_parts is not None and (start - cur_end) <= max_gap:
             # Merge with previous
-            merged[-1]["end"] = seg["end"]
-            if seg["text"]:
-                merged[-1]["text"] = (merged[-1]["text"] + " " + seg["text"]).strip()
+            cur_end = end
+            if text:
+                cur_parts.append(text)
         else:
-            merged.append(seg)
+            if cur_parts is not None:
+                merged.append({"start": cur_start, "end": cur_end, "text": _join_texts(cur_parts)})
+            cur_start, cur_end, cur_parts = start, end, [text]
+
+    if cur_parts is not None:
+        merged.append({"start": cur_start, "end": cur_end, "text": _join_texts(cur_parts)})
 
     return merged
 
 
+def _join_texts(parts: List[str]) -> str:
+    """
+    Join the texts of merged segments.
+
+    Same result as folding (text + " " + part).strip() over the parts; the
+    fold is only run when a part has surrounding whitespace (or the first
+    text is empty), where stripping changes more than the ends.
+    """
+    text = parts[0]
+    if len(parts) == 1:
+        return text
+    if text and all(part == part.strip() for part in parts):
+        return " ".join(parts)
+    for part in parts[1:]:
+        text = (text + " " + part).strip()
+    return text
+
+
 def load_transcript(path: Path) -> Dict[str, Any]:
     """
     Load and parse a transcript JSON file.
 
+    Every call parses the file again and returns a new dict that the
+    caller may modify. Parsed results are deliberately not cached: a
+    shared dict would leak one caller's edits into later loads, and
+    deep-copying a parsed transcript costs several times more than
+    parsing it again.
+
     Args:
         path: Path to transcript JSON file
 
@@ -298,8 +485,13 @@ def load_transcript(path: Path) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file is not valid JSON
+        json.JSONDecodeError: If file is not valid JSON (orjson's error
+            subclasses it)
     """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
     import json
     with open(path, "r") as f:
         return json.load(f)
@@ -204,6 +204,19 @@ class TestRecursiveReplacement(unittest.TestCase):
 class TestMappingParsers(unittest.TestCase):
     """Test various mapping input formats."""
 
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._map_file = os.path.join(self._temp_dir.name, "speakers.txt")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write_map_file(self, content):
+        """Write a mapping file into the test's temp dir and return its path."""
+        with open(self._map_file, "w") as f:
+            f.write(content)
+        return self._map_file
+
     def test_parse_inline_simple(self):
         """Test comma-separated inline parsing."""
         detected = {"A", "B", "C"}
@@ -239,109 +252,90 @@ class TestMappingParsers(unittest.TestCase):
 
     def test_parse_file_sequential(self):
         """Test sequential file format."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("Alice Anderson\n")
-            f.write("Beat Barrinson\n")
-            f.write("Charlie Chaplin\n")
-            temp_file = f.name
-
-        try:
-            detected = {"A", "B", "C"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
-
-            self.assertEqual(speaker_map, {
-                "A": "Alice Anderson",
-                "B": "Beat Barrinson",
-                "C": "Charlie Chaplin"
-            })
-        finally:
-            os.unlink(temp_file)
+        temp_file = self._write_map_file(
+            "Alice Anderson\n"
+            "Beat Barrinson\n"
+            "Charlie Chaplin\n"
+        )
+
+        detected = {"A", "B", "C"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+
+        self.assertEqual(speaker_map, {
+            "A": "Alice Anderson",
+            "B": "Beat Barrinson",
+            "C": "Charlie Chaplin"
+        })
 
     def test_parse_file_keyvalue_simple(self):
         """Test key:value file format."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("A: Alice Anderson\n")
-            f.write("B: Beat Barrinson\n")
-            temp_file = f.name
-
-        try:
-            detected = {"A", "B"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
-
-            self.assertEqual(speaker_map, {
-                "A": "Alice Anderson",
-                "B": "Beat Barrinson"
-            })
-        finally:
-            os.unlink(temp_file)
+        temp_file = self._write_map_file(
+            "A: Alice Anderson\n"
+            "B: Beat Barrinson\n"
+        )
+
+        detected = {"A", "B"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+
+        self.assertEqual(speaker_map, {
+            "A": "Alice Anderson",
+            "B": "Beat Barrinson"
+        })
 
     def test_parse_file_keyvalue_full_labels(self):
         """Test full speaker label format."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("Speaker A: Alice Anderson\n")
-            f.write("Speaker B: Beat Barrinson\n")
-            temp_file = f.name
-
-        try:
-            detected = {"Speaker A", "Speaker B"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
-
-            self.assertEqual(speaker_map, {
-                "Speaker A": "Alice Anderson",
-                "Speaker B": "Beat Barrinson"
-            })
-        finally:
-            os.unlink(temp_file)
+        temp_file = self._write_map_file(
+            "Speaker A: Alice Anderson\n"
+            "Speaker B: Beat Barrinson\n"
+        )
+
+        detected = {"Speaker A", "Speaker B"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+
+        self.assertEqual(speaker_map, {
+            "Speaker A": "Alice Anderson",
+            "Speaker B": "Beat Barrinson"
+        })
 
     def test_parse_file_mixed_format(self):
         """Test mixed key:value formats."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("A: Alice\n")
-            f.write("Speaker B: Bob\n")
-            f.write("C: Charlie\n")
-            temp_file = f.name
-
-        try:
-            detected = {"A", "Speaker B", "C"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
-
-            self.assertEqual(speaker_map, {
-                "A": "Alice",
-                "Speaker B": "Bob",
-                "C": "Charlie"
-            })
-        finally:
-            os.unlink(temp_file)
+        temp_file = self._write_map_file(
+            "A: Alice\n"
+            "Speaker B: Bob\n"
+            "C: Charlie\n"
+        )
+
+        detected = {"A", "Speaker B", "C"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+
+        self.assertEqual(speaker_map, {
+            "A": "Alice",
+            "Speaker B": "Bob",
+            "C": "Charlie"
+        })
 
     def test_parse_file_with_comments(self):
         """Test file with comment lines."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("# Project speakers\n")
-            f.write("A: Alice\n")
-            f.write("# B is unknown\n")
-            f.write("C: Charlie\n")
-            temp_file = f.name
+        temp_file = self._write_map_file(
+            "# Project speakers\n"
+            "A: Alice\n"
+            "# B is unknown\n"
+            "C: Charlie\n"
+        )
 
-        try:
-            detected = {"A", "C"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+        detected = {"A", "C"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
 
-            self.assertEqual(speaker_map, {"A": "Alice", "C": "Charlie"})
-        finally:
-            os.unlink(temp_file)
+        self.assertEqual(speaker_map, {"A": "Alice", "C": "Charlie"})
 
     def test_parse_file_empty(self):
         """Test empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            temp_file = f.name
+        temp_file = self._write_map_file("")
 
-        try:
-            detected = {"A", "B"}
-            speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
+        detected = {"A", "B"}
+        speaker_map = mapper.parse_speaker_map_file(temp_file, detected)
 
-            self.assertEqual(speaker_map, {})
-        finally:
-            os.unlink(temp_file)
+        self.assertEqual(speaker_map, {})
 
 
 class TestTranscriptGeneration(unittest.TestCase):